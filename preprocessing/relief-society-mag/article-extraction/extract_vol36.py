@@ -5,10 +5,10 @@ Extraction script for Relief Society Magazine Volume 36 (1949).
 Reads cleaned monthly issue files from cleaned-data/ and extracts them into
 individual entries (articles, poems, editorials, fiction, lessons, etc.).
 
-Each entry is matched using two strategies (strict line-start and loose
-anywhere-match) and both results are written as separate text files plus
-a per-volume JSON containing full content. See processed/README.md for
-schema documentation.
+Each entry's title is matched once, anywhere in the issue body (there is
+no separate strict line-start pass), and each match is written as a text
+file plus a per-volume JSON containing full content. See processed/README.md
+for schema documentation.
 
 TOC Format Handling:
 - Handles section headers with variable spacing (e.g., "FICTIONTitle" vs "FICTION Title")
@@ -18,15 +18,32 @@ TOC Format Handling:
 Usage:
     python extract_vol36.py
     python extract_vol36.py --dry-run
+    python extract_vol36.py --workers 4
+    python extract_vol36.py --omit-content
+    python extract_vol36.py --verbose
 """
 
 import argparse
+import contextlib
 import csv
+import enum
+import functools
+import io
 import json
+import mmap
 import os
 import re
 import sys
+import types
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
+from typing import NamedTuple
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 # ---------------------------------------------------------------------------
 # Paths
@@ -34,564 +51,174 @@ from pathlib import Path
 PROJECT_ROOT = Path(__file__).resolve().parents[3]  # up from article-extraction → relief-society-mag → preprocessing → root
 OUTPUT_DIR = PROJECT_ROOT / "processed" / "regex_and_llm"
 
+# manifest.csv columns; manifest rows are tuples in this order
+MANIFEST_FIELDS = ("file", "path", "volume", "month", "etype",
+                   "title", "author", "strategy")
+
 # ---------------------------------------------------------------------------
 # Helper to sanitize filenames
 # ---------------------------------------------------------------------------
+# Characters not safe for filenames, deleted outright
+_FN_BAD_TABLE = str.maketrans('', '', '<>:"/\\|?*')
+# Runs of spaces, special chars and underscores, each collapsed to one '_'
+_FN_SEP_RE = re.compile(r'[\s\-,;.!\'()_]+')
+
+
+def _sanitize_chars(s: str) -> str:
+    """Filename-safe form of an already stripped string, before clipping."""
+    if s.isascii() and s.replace(' ', '').isalnum() and '  ' not in s:
+        # Plain words separated by single spaces: nothing to drop or collapse
+        return s.replace(' ', '_')
+    # Drop characters not safe for filenames
+    s = s.translate(_FN_BAD_TABLE)
+    # Replace runs of spaces/special chars/underscores with one underscore
+    s = _FN_SEP_RE.sub('_', s)
+    # Strip trailing underscores
+    return s.strip('_')
+
+
+@functools.lru_cache(maxsize=2048)
 def sanitize_filename(s: str, max_len: int = 80) -> str:
-    """Turn a title/author string into a safe filename component."""
+    """
+    Turn a title/author string into a safe filename component.
+    Cached, since department titles recur in every issue.
+    """
     s = s.strip()
-    # Replace characters not safe for filenames
-    s = re.sub(r'[<>:"/\\|?*]', '', s)
-    # Replace spaces and runs of special chars with underscores
-    s = re.sub(r'[\s\-,;.!\'()]+', '_', s)
-    # Collapse multiple underscores
-    s = re.sub(r'_+', '_', s)
-    # Strip trailing underscores
-    s = s.strip('_')
+    limit = max_len * 2
+    if len(s) > limit:
+        # Sanitizing only shortens text and never changes what precedes a
+        # position, so a prefix that still comes out longer than max_len
+        # clips to the same filename.  Otherwise fall back to the whole.
+        head = _sanitize_chars(s[:limit].rstrip())
+        s = head if len(head) > max_len else _sanitize_chars(s)
+    else:
+        s = _sanitize_chars(s)
     if len(s) > max_len:
         print(f"WARNING: filename {s} exceeds 80 chars and is being clipped.")
         s = s[:max_len].rstrip('_')
     return s
 
 
+# ---------------------------------------------------------------------------
+# Entry types
+# ---------------------------------------------------------------------------
+class EType(enum.IntEnum):
+    """Entry type classification.  Output files use the member name."""
+    article = 0
+    poem = 1
+    fiction = 2
+    lesson = 3
+    editorial = 4
+    report = 5
+
+
+class Entry(NamedTuple):
+    """A single TOC entry.  filename_stem is the sanitized title."""
+    title: str
+    author: str | None
+    etype: EType
+    filename_stem: str
+
+
 # ---------------------------------------------------------------------------
 # TOC DATA
 #
-# Each issue is keyed by (volume, issue_identifier) where issue_identifier
-# matches the filename pattern.  Entries are in the order they appear in the
-# magazine.  The regex will search for the title (and optionally author) as
-# boundary markers.
-#
-# Fields per entry:
-#   title  - the title as it appears in the text (used for regex matching)
-#   author - author name or None
-#   etype  - entry type classification
+# The TOC lives in vol36_toc.py and is only imported when first needed, so
+# importing this module for its helpers does not build the whole table.
+# load_toc() freezes it into a read-only mapping of tuples of Entry.
 # ---------------------------------------------------------------------------
 
-VOL36_TOC = {
-    ("Vol36", "No01_January_1949"): [
-        {"title": "January Snow", "author": "Eva Willes Wangsgaard", "etype": "poem"},
-        {"title": "New Year Greetings", "author": "General Presidency of Relief Society", "etype": "article"},
-        {"title": "The Modern Family and Spirituality", "author": "Achsa E. Paxman", "etype": "article"},
-        {"title": "Award Winners—Eliza R. Snow Poem Contest", "author": None, "etype": "article"},
-        {"title": "Profile of Joseph—First Prize Poem", "author": "Dorothy J. Roberts", "etype": "article"},
-        {"title": "Another Mary—Second Prize Poem", "author": "Miranda Snow Walton", "etype": "article"},
-        {"title": "Infant Daughter of...—Third Prize Poem", "author": "Alice M. Burnett", "etype": "article"},
-        {"title": "Award Winners—Annual Relief Society Story Contest", "author": None, "etype": "article"},
-        {"title": "The Hurrahs Nest—First Prize Story", "author": "Estelle Webb Thomas", "etype": "article"},
-        {"title": "President Belle S. Spafford Elected to Office in the National Council", "author": "Priscilla L. Evans", "etype": "article"},
-        {"title": "Artist", "author": "Gene Romolo", "etype": "poem"},
-        {"title": "Relief Society Building News", "author": None, "etype": "article"},
-        {"title": "Give Love", "author": "Gertrude T. Koven", "etype": "poem"},
-        {"title": "Joanna—Chapter 1", "author": "Margery S. Stewart", "etype": "fiction"},
-        {"title": "Sixty Years Ago", "author": None, "etype": "article"},
-        {"title": "Womans Sphere", "author": "Ramona W. Cannon", "etype": "article"},
-        {"title": "Editorial: Renascence 1949", "author": "Marianne C. Sharp", "etype": "article"},
-        {"title": "Notes to the Field", "author": None, "etype": "article"},
-        {"title": "Quick and Easy Dinners", "author": "Sara Mills", "etype": "article"},
-        {"title": "Be Swell", "author": "Julene J. Cushing", "etype": "poem"},
-        {"title": "The Dress—Part I", "author": "Fay Tarlock", "etype": "fiction"},
-        {"title": "How to Make a Kapok Quilt", "author": "Ilean H. Poulson", "etype": "article"},
-        {"title": "Once Remembered", "author": "Wanda Greene Nielson", "etype": "poem"},
-        {"title": "Notes From the Field: Handicraft, Sewing, and Other Activities", "author": None, "etype": "article"},
-        {"title": "The Conductor and the Accompanist", "author": "Florence Jepperson Madsen", "etype": "article"},
-        {"title": "All in a Days Pleasure", "author": "Helen Martin", "etype": "article"},
-        {"title": "Where White Lilies Grow", "author": "Elsie Chamberlain Carroll", "etype": "poem"},
-        {"title": "On Waking", "author": "Christie Lund Coles", "etype": "poem"},
-        {"title": "Theology: The Transfiguration", "author": "Elder Don B. Colton", "etype": "lesson"},
-        {"title": "Work Meeting—Sewing: Use Your Odds and Ends", "author": "Jean Ridges Jennings", "etype": "lesson"},
-        {"title": "Literature: Literary Sidelights of the Founding Years", "author": "Elder Howard R. Driggs", "etype": "lesson"},
-        {"title": "Visiting Teachers Messages: I Will Not Leave You Comfortless", "author": "Elder H. Wayne Driggs", "etype": "lesson"},
-        {"title": "From a Hospital Window", "author": "Evelyn Fjeldsted", "etype": "poem"},
-        {"title": "To a Seeing-Eye Dog", "author": "Marvin Jones", "etype": "poem"},
-        {"title": "Social Science: Contemporary Domestic Problems", "author": "Elder G. Homer Durham", "etype": "lesson"},
-        {"title": "Be Still and Know", "author": "Beatrice K. Ekman", "etype": "poem"},
-        {"title": "Optional Lessons in Lieu of Social Science: The Presidency of Wilford Woodruff", "author": "Elder T. Edgar Lyon", "etype": "lesson"},
-        {"title": "Prayer", "author": "Gladys I. Hamilton", "etype": "poem"},
-        {"title": "Do Hearts Grow?", "author": "Josephine J. Harvey", "etype": "poem"},
-        {"title": "Lyric of Being", "author": "Ruth Harwood", "etype": "poem"},
-        {"title": "From Near and Far", "author": None, "etype": "article"},
-    ],
-
-    ("Vol36", "No02_February_1949"): [
-        {"title": "Unwritten Song", "author": "Anna Prince Redd", "etype": "poem"},
-        {"title": "A Memorial to the Relief Society Sisters", "author": "Lydia M. Tanner", "etype": "article"},
-        {"title": "Relief Society Building News", "author": None, "etype": "article"},
-        {"title": "Heart-Deep in Winter", "author": "Eva Willes Wangsgaard", "etype": "poem"},
-        {"title": "They Die in the Harness—Second Prize Story", "author": "Myrtle M. Dean", "etype": "fiction"},
-        {"title": "Violin", "author": "Susa Gould Walker", "etype": "poem"},
-        {"title": "Remuneration", "author": "Alice Whitson Norton", "etype": "poem"},
-        {"title": "The Symbol of a Dream", "author": "Verda Mae Fuller", "etype": "article"},
-        {"title": "From the Shadow of a Dream to the Sunlight of Promise", "author": "Vesta P. Crawford", "etype": "article"},
-        {"title": "Women Against Polio", "author": "Caroline Eyring Miner", "etype": "article"},
-        {"title": "Sixty Years Ago", "author": None, "etype": "article"},
-        {"title": "Womans Sphere", "author": "Ramona W. Cannon", "etype": "article"},
-        {"title": "Editorial: Remembrance for February", "author": "Vesta P. Crawford", "etype": "article"},
-        {"title": "Congratulations to President Amy Brown Lyman on Her Birthday", "author": None, "etype": "article"},
-        {"title": "Take What You Can", "author": "Christie Lund Coles", "etype": "poem"},
-        {"title": "The Sane View", "author": "Elaine Whitelaw", "etype": "article"},
-        {"title": "Winter Peace", "author": "Dorothy J. Roberts", "etype": "poem"},
-        {"title": "Joanna—Chapter 2", "author": "Margery S. Stewart", "etype": "fiction"},
-        {"title": "Forgiveness", "author": "C. Cameron Johns", "etype": "poem"},
-        {"title": "Home", "author": "Beatrice K. Ekman", "etype": "poem"},
-        {"title": "The Dress—Part II", "author": "Fay Tarlock", "etype": "fiction"},
-        {"title": "Notes From the Field: Visiting Teachers Activities, New Organizations, and Anniversary Work", "author": "General Secretary-Treasurer, Margaret C. Pickering", "etype": "article"},
-        {"title": "Theology: From Sunshine to Shadow", "author": "Elder Don B. Colton", "etype": "lesson"},
-        {"title": "Map of Palestine at the Time of Christ", "author": None, "etype": "lesson"},
-        {"title": "The Greatest Love", "author": "Caroline Eyring Miner", "etype": "article"},
-        {"title": "Defeat", "author": "Evelyn Fjeldsted", "etype": "poem"},
-        {"title": "Visiting Teachers Messages: Ye Are the Light of the World", "author": "Elder H. Wayne Driggs", "etype": "lesson"},
-        {"title": "Communion at Midnight", "author": "Lizabeth Wall", "etype": "poem"},
-        {"title": "Literature: Literature of the Prophets Closing Years", "author": "Elder Howard R. Driggs", "etype": "lesson"},
-        {"title": "Social Science: International Strife and the Quest for Peace", "author": "Elder G. Homer Durham", "etype": "lesson"},
-        {"title": "Optional Lessons in Lieu of Social Science: The Presidency of Lorenzo Snow", "author": "Elder T. Edgar Lyon", "etype": "lesson"},
-        {"title": "From Near and Far", "author": None, "etype": "article"},
-        {"title": "Comparison", "author": "Anna S. W. Gould", "etype": "poem"},
-    ],
-
-    ("Vol36", "No03_March_1949"): [
-        {"title": "Vol. 36 MARCH 1949 No.", "author": None, "etype": "article"},
-        {"title": "I Have Seen Aspens", "author": "Alice Morrey Bailey", "etype": "poem"},
-        {"title": "The Spirit of the Gospel, the Soul of Relief Society", "author": "President Belle S. Spafford", "etype": "article"},
-        {"title": "Compromise—Third Prize Story", "author": "Mildred R. Stutz", "etype": "fiction"},
-        {"title": "Relief Society Building News", "author": None, "etype": "article"},
-        {"title": "The Song of the Lark", "author": "Ivy Williams Stone", "etype": "article"},
-        {"title": "This of Destiny", "author": "Elizabeth Terry Blair", "etype": "poem"},
-        {"title": "The House of Leaves", "author": "Blanche Sutherland", "etype": "fiction"},
-        {"title": "A Young Mother Discovers Relief Society", "author": "Margaret F. Richards", "etype": "article"},
-        {"title": "Hawaii and the Latter-day Saints", "author": "Rosannah Cannon Irvine", "etype": "article"},
-        {"title": "Clean-up and Beautification Program", "author": "James M. Kirkham", "etype": "article"},
-        {"title": "Sixty Years Ago", "author": None, "etype": "article"},
-        {"title": "Womans Sphere", "author": "Ramona W. Cannon", "etype": "article"},
-        {"title": "Editorial: Full Measure, Running Over", "author": "Marianne C. Sharp", "etype": "article"},
-        {"title": "Notes to the Field: The Importance of the Visiting Teachers Message", "author": None, "etype": "article"},
-        {"title": "Organizations and Reorganizations of Mission and Stake Relief Societies", "author": None, "etype": "article"},
-        {"title": "Special Short Story Issue Planned for April", "author": None, "etype": "article"},
-        {"title": "Sky Writing", "author": "Marvin Jones", "etype": "poem"},
-        {"title": "Longing", "author": "Susa Gould Walker", "etype": "poem"},
-        {"title": "We Are So Busy", "author": "Sylvia Probst Young", "etype": "fiction"},
-        {"title": "Take Care of Your Books", "author": "Ezra J. Poulsen", "etype": "article"},
-        {"title": "I Have No Need", "author": "Grace Zenor Pratt", "etype": "poem"},
-        {"title": "How to Make a Pleated Skirt", "author": "Lena DuPaix", "etype": "article"},
-        {"title": "They Are Not Mine", "author": "Caroline Eyring Miner", "etype": "article"},
-        {"title": "Compensation", "author": "Jessie M. Robinson", "etype": "poem"},
-        {"title": "How to Make an Embroidery Floss Case", "author": "Afton N. Porter", "etype": "article"},
-        {"title": "Thats My Target!", "author": "Ivie H. Jones", "etype": "article"},
-        {"title": "Art Teacher", "author": "C. Cameron Johns", "etype": "poem"},
-        {"title": "Antiques to Know and Cherish", "author": "Lorene Pearson", "etype": "article"},
-        {"title": "Cotton Storm", "author": "Leone E. McCune", "etype": "poem"},
-        {"title": "Overtone", "author": "Dorothy J. Roberts", "etype": "poem"},
-        {"title": "Cakes Decorated and Designed at Home", "author": "Eva Willes Wangsgaard", "etype": "article"},
-        {"title": "Joanna—Chapter 3", "author": "Margery S. Stewart", "etype": "fiction"},
-        {"title": "Notes From the Field: Relief Society Socials, Bazaars, and Other Activities", "author": "General Secretary-Treasurer, Margaret C. Pickering", "etype": "article"},
-        {"title": "My Wish", "author": "Gene Romolo", "etype": "poem"},
-        {"title": "Spring Candlelight", "author": "Thelma Ireland", "etype": "poem"},
-        {"title": "From Near and Far", "author": None, "etype": "article"},
-    ],
-
-    ("Vol36", "No04_April_1949"): [
-        {"title": "Vol. 36 APRIL 1949 No.", "author": None, "etype": "article"},
-        {"title": "The Half-Believers", "author": "Berta H. Christensen", "etype": "poem"},
-        {"title": "Jesus—Lord of the Resurrection", "author": "Elder Don B. Colton", "etype": "article"},
-        {"title": "The Bog", "author": "Christie Lund Coles", "etype": "fiction"},
-        {"title": "Relief Society Building News", "author": None, "etype": "article"},
-        {"title": "Our Political Inheritance", "author": "Elder G. Homer Durham", "etype": "article"},
-        {"title": "Once", "author": "Belle W. Anderson", "etype": "poem"},
-        {"title": "April Geography", "author": "Ruth Harwood", "etype": "poem"},
-        {"title": "Long Moment", "author": "Rose Thomas Graham", "etype": "poem"},
-        {"title": "Trumpets", "author": "Mary Ek Knowles", "etype": "fiction"},
-        {"title": "Of April Blossoming", "author": "Renie H. Littlewood", "etype": "poem"},
-        {"title": "Through the Darkness", "author": "Hazel K. Todd", "etype": "fiction"},
-        {"title": "The Family Hour in Latter-day Saint Homes", "author": "Lucy Grant Cannon", "etype": "article"},
-        {"title": "Spring", "author": "Beatrice Knowlton Ekman", "etype": "poem"},
-        {"title": "Grantsville and the Desert", "author": "Norma Wrathall", "etype": "article"},
-        {"title": "Sixty Years Ago", "author": None, "etype": "article"},
-        {"title": "Womans Sphere", "author": "Ramona W. Cannon", "etype": "article"},
-        {"title": "Editorial: The Women of Easter", "author": "Vesta P. Crawford", "etype": "article"},
-        {"title": "Congratulations to President Smith on His Seventy-Ninth Birthday", "author": None, "etype": "article"},
-        {"title": "Instructions Regarding Notes From the Field", "author": None, "etype": "article"},
-        {"title": "Table Settings and Flower Arrangements: Easter Table Suggestions", "author": "Mary Grant Judd", "etype": "article"},
-        {"title": "Consider the Lilies", "author": "Jean Chalmers Donaldson", "etype": "poem"},
-        {"title": "The Heart Grows Quiet", "author": "Dorothy J. Roberts", "etype": "poem"},
-        {"title": "An April Day", "author": "Grace M. Candland", "etype": "poem"},
-        {"title": "And All Eternity", "author": "Carol Read Flake", "etype": "fiction"},
-        {"title": "Annual Urge", "author": "Maryhale Woolsey", "etype": "poem"},
-        {"title": "An Easter Party for the Children", "author": "Elizabeth Williamson", "etype": "article"},
-        {"title": "Joanna—Chapter 4", "author": "Margery S. Stewart", "etype": "fiction"},
-        {"title": "Easter-Lily Floor", "author": "Julene J. Cushing", "etype": "poem"},
-        {"title": "Notes From the Field: Socials, Bazaars, and Other Activities", "author": "General Secretary-Treasurer, Margaret C. Pickering", "etype": "article"},
-        {"title": "Eighty-Seventh Birthday", "author": "Nan S. Richardson", "etype": "poem"},
-        {"title": "From Near and Far", "author": None, "etype": "article"},
-    ],
-
-    ("Vol36", "No05_May_1949"): [
-        {"title": "Vol. 36 MAY 1949 No.", "author": None, "etype": "article"},
-        {"title": "This Happy Land", "author": "Nyal W. Anderson", "etype": "poem"},
-        {"title": "Our Responsibility to Inactive Members", "author": "Velma N. Simonsen", "etype": "article"},
-        {"title": "Mothers of Destiny", "author": "Christie Lund Coles", "etype": "poem"},
-        {"title": "May Day", "author": "Ruth Harwood", "etype": "poem"},
-        {"title": "A Pattern for Christine", "author": "Dorothy J. Roberts", "etype": "fiction"},
-        {"title": "Pansy Faces", "author": "Zara Sabin", "etype": "poem"},
-        {"title": "Civil Liberty Today", "author": "G. Homer Durham", "etype": "article"},
-        {"title": "You Might Have Waited", "author": "Fay Tarlock", "etype": "fiction"},
-        {"title": "American Cancer Society Volunteers", "author": "Bertha Hare Long", "etype": "article"},
-        {"title": "Formula", "author": "Anna Prince Redd", "etype": "poem"},
-        {"title": "Planning the Work Meetings", "author": "Leone G. Layton", "etype": "article"},
-        {"title": "Sixty Years Ago", "author": None, "etype": "article"},
-        {"title": "Womans Sphere", "author": "Ramona W. Cannon", "etype": "article"},
-        {"title": "Editorial: Not in the Abundance of the Things Which He Possesseth", "author": "Marianne C. Sharp", "etype": "article"},
-        {"title": "Released to Spring", "author": "C. Cameron Johns", "etype": "poem"},
-        {"title": "Midas and the Five Senses", "author": "Eva Willes Wangsgaard", "etype": "poem"},
-        {"title": "Tears First Dried", "author": "Jeanette P. Parry", "etype": "poem"},
-        {"title": "Joanna—Chapter 5", "author": "Margery S. Stewart", "etype": "fiction"},
-        {"title": "Luncheon Cloths for the Making", "author": "Rachel K. Laurgaard", "etype": "article"},
-        {"title": "Braided Rugs—New-Fashioned", "author": "Drucilla S. Howard", "etype": "article"},
-        {"title": "Spring Planting", "author": "LeRoy Burke Meagher", "etype": "poem"},
-        {"title": "Dawn", "author": "Evelyn Fjeldsted", "etype": "poem"},
-        {"title": "Table Settings and Flower Arrangements: Entertaining the Bride", "author": "Mary Grant Judd", "etype": "article"},
-        {"title": "Magazine Subscriptions for 1948", "author": "Marianne C. Sharp", "etype": "article"},
-        {"title": "The Magazine Honor Roll for 1948", "author": None, "etype": "article"},
-        {"title": "Handle With Gloves", "author": "Ivie H. Jones", "etype": "article"},
-        {"title": "Rainbow Land", "author": "Marvin Jones", "etype": "poem"},
-        {"title": "Notes From the Field: Relief Society Bazaars, Socials, and Other Activities", "author": "General Secretary-Treasurer, Margaret C. Pickering", "etype": "article"},
-        {"title": "From Near and Far", "author": None, "etype": "article"},
-    ],
-
-    ("Vol36", "No06_June_1949"): [
-        {"title": "Vol. 36 JUNE 1949 No.", "author": None, "etype": "article"},
-        {"title": "Sweet Memory", "author": "Dorothy J. Roberts", "etype": "poem"},
-        {"title": "A Measuring Rod for Growth", "author": "Blanche B. Stoddard", "etype": "article"},
-        {"title": "Contest Announcements—1949", "author": None, "etype": "article"},
-        {"title": "Temple Shadows", "author": "Lizabeth Wall", "etype": "poem"},
-        {"title": "Roses Wet With Rain", "author": "Grace Sayre", "etype": "poem"},
-        {"title": "Points for Poets to Remember", "author": "Eva Willes Wangsgaard", "etype": "article"},
-        {"title": "By Memory", "author": "Evelyn Fjeldsted", "etype": "poem"},
-        {"title": "On Writing a Short Story", "author": "Fay Tarlock", "etype": "article"},
-        {"title": "A Song the Heart Must Sing", "author": "Anna Prince Redd", "etype": "poem"},
-        {"title": "Impressions", "author": "Elise B. Maness", "etype": "poem"},
-        {"title": "June", "author": "Christie Lund Coles", "etype": "poem"},
-        {"title": "Young Hearts Are Fragile", "author": "Olive W. Burt", "etype": "fiction"},
-        {"title": "El Paso and the Latter-day Saints", "author": "Sadie Ollorton Clark", "etype": "article"},
-        {"title": "Prayer", "author": "Gene Romolo", "etype": "poem"},
-        {"title": "My Mountain", "author": "Josephine J. Harvey", "etype": "poem"},
-        {"title": "If", "author": "Catherine Renstrom", "etype": "poem"},
-        {"title": "Orchid Hunting in Honduras", "author": "Elizabeth Williamson", "etype": "article"},
-        {"title": "Selective Memory", "author": "Clarence Edwin Flynn", "etype": "poem"},
-        {"title": "Sixty Years Ago", "author": None, "etype": "article"},
-        {"title": "Womans Sphere", "author": "Ramona W. Cannon", "etype": "article"},
-        {"title": "Editorial: The One Hundred Nineteenth Annual General Conference", "author": "Leone G. Layton", "etype": "article"},
-        {"title": "In Memoriam: Mary Ah Ping Ty", "author": None, "etype": "article"},
-        {"title": "Deseret Sunday School Union Centennial Conference", "author": None, "etype": "article"},
-        {"title": "Corrections in Magazine Honor Roll", "author": None, "etype": "article"},
-        {"title": "Of Silver Laughter", "author": "Renie H. Littlewood", "etype": "poem"},
-        {"title": "Table Settings and Flower Arrangements: Pleasure From Simple Things", "author": "A. J. Neff", "etype": "article"},
-        {"title": "Margery", "author": "Katherine F. Larsen", "etype": "poem"},
-        {"title": "Pressed Flower Pictures—a Designing Hobby", "author": None, "etype": "article"},
-        {"title": "Inner Resources", "author": "Caroline Eyring Miner", "etype": "article"},
-        {"title": "A Familys a Family", "author": "Estelle Webb Thomas", "etype": "fiction"},
-        {"title": "Rescue That Little Rocker", "author": "Rachel K. Laurgaard", "etype": "article"},
-        {"title": "Carrot Marmalade", "author": "Frances Kolarik", "etype": "article"},
-        {"title": "Joanna—Chapter 6", "author": "Margery S. Stewart", "etype": "fiction"},
-        {"title": "Notes From the Field: Anniversary Socials, Bazaars, and Other Activities", "author": "General Secretary-Treasurer, Margaret C. Pickering", "etype": "article"},
-        {"title": "From Near and Far", "author": None, "etype": "article"},
-    ],
-
-    ("Vol36", "No07_July_1949"): [
-        {"title": "Vol. 36 JULY 1949 No.", "author": None, "etype": "article"},
-        {"title": "Pioneer Mother", "author": "Ruth H. Chadwick", "etype": "poem"},
-        {"title": "For Those Who Come After", "author": "Anna Prince Redd", "etype": "article"},
-        {"title": "A Tribute to the Pioneer Mother", "author": "Lucy Fryer Vance", "etype": "article"},
-        {"title": "Nellie Ward Neal Appointed to the Relief Society General Board", "author": "Roxey Robson Heslop", "etype": "article"},
-        {"title": "Tiny Feet", "author": "Iris W. Schow", "etype": "poem"},
-        {"title": "Embryo", "author": "C. Cameron Johns", "etype": "poem"},
-        {"title": "Mood of Alice", "author": "Ruth Harwood", "etype": "poem"},
-        {"title": "The Land of the High Uintahs", "author": "Olive W. Burt", "etype": "article"},
-        {"title": "The Jumpher Family: Mama and Papa", "author": "Deone R. Sutherland", "etype": "fiction"},
-        {"title": "Sixty Years Ago", "author": None, "etype": "article"},
-        {"title": "Womans Sphere", "author": "Ramona W. Cannon", "etype": "article"},
-        {"title": "Editorial: The New Frontier", "author": "Vesta P. Crawford", "etype": "article"},
-        {"title": "Birthday Greetings to Sister Augusta Winters Grant", "author": None, "etype": "article"},
-        {"title": "Table Settings and Flower Arrangements: Table Settings for the Canyon", "author": "Mary Grant Judd", "etype": "article"},
-        {"title": "Fireworks", "author": "Christie Lund Coles", "etype": "poem"},
-        {"title": "Joanna—Chapter 7", "author": "Margery S. Stewart", "etype": "fiction"},
-        {"title": "Louisa Allen Thomas Makes a Pioneer Quilt", "author": None, "etype": "article"},
-        {"title": "Lets Vary the Picnic Menu", "author": "Rachel K. Laurgaard", "etype": "article"},
-        {"title": "Make Use of the Rocks", "author": "Ezra J. Poulsen", "etype": "article"},
-        {"title": "Bear Lake", "author": "Eva Willes Wangsgaard", "etype": "poem"},
-        {"title": "Salads of Infinite Variety", "author": "Sara Mills", "etype": "article"},
-        {"title": "Suggestions for a Work Meeting Luncheon", "author": "Christine Eaton", "etype": "article"},
-        {"title": "Notes on Authors of the Lessons", "author": None, "etype": "lesson"},
-        {"title": "That America Might Be", "author": "Mabel Jones Gabbott", "etype": "poem"},
-        {"title": "Theology: The Life and Ministry of the Savior, Preview", "author": None, "etype": "lesson"},
-        {"title": "Jesus Began in Galilee", "author": "Don B. Colton", "etype": "lesson"},
-        {"title": "Visiting Teacher Messages: Our Savior Speaks, Preview", "author": None, "etype": "lesson"},
-        {"title": "I Am Come That They Might Have Life", "author": "Mary Grant Judd", "etype": "lesson"},
-        {"title": "Work Meeting—Sewing Childrens Clothing, Preview", "author": None, "etype": "lesson"},
-        {"title": "Proper Selection of Style, Choice of Material and Pattern", "author": "Jean Ridges Jennings", "etype": "lesson"},
-        {"title": "Literature: The Literature of England, Preview", "author": None, "etype": "lesson"},
-        {"title": "Introduction", "author": "Briant S. Jacobs", "etype": "lesson"},
-        {"title": "Social Science: The Progress of Man, Preview", "author": None, "etype": "lesson"},
-        {"title": "President Joseph F. Smith", "author": "T. Edgar Lyon", "etype": "lesson"},
-        {"title": "Music: Fundamentals of Musicianship, Preview", "author": None, "etype": "lesson"},
-        {"title": "Patriot Day", "author": "Josephine J. Harvey", "etype": "poem"},
-        {"title": "The First Presidencies, Preview", "author": None, "etype": "lesson"},
-        {"title": "Upon the Bluebirds Wing", "author": "Margaret B. Shomaker", "etype": "poem"},
-        {"title": "From Near and Far", "author": None, "etype": "article"},
-    ],
-
-    ("Vol36", "No08_August_1949"): [
-        {"title": "Vol. 36 AUGUST 1949 No.", "author": None, "etype": "article"},
-        {"title": "Sand and Flame", "author": "Anna Prince Redd", "etype": "poem"},
-        {"title": "The Tasks of Modern Citizenship", "author": "G. Homer Durham", "etype": "article"},
-        {"title": "Immortality", "author": "Jessie M. Robinson", "etype": "poem"},
-        {"title": "Relief Society Building News", "author": None, "etype": "article"},
-        {"title": "More at Peace", "author": "Christie Lund Coles", "etype": "poem"},
-        {"title": "Music in the Home", "author": "Norma Wrathall", "etype": "fiction"},
-        {"title": "Rugmaking in the New England Mission", "author": "S. Dilworth Young", "etype": "article"},
-        {"title": "August", "author": "Mary Rigby", "etype": "poem"},
-        {"title": "The Jumpher Family: Part II—Ready", "author": "Deone R. Sutherland", "etype": "fiction"},
-        {"title": "Moment", "author": "Georgia Moore Eberling", "etype": "poem"},
-        {"title": "Remembrance", "author": "Ora Lee Parthesius", "etype": "poem"},
-        {"title": "What The Relief Society Magazine Means to Me", "author": "Alice Morrey Bailey", "etype": "article"},
-        {"title": "Words and Music", "author": "Bernice Brown", "etype": "fiction"},
-        {"title": "Sixty Years Ago", "author": None, "etype": "article"},
-        {"title": "Womans Sphere", "author": "Ramona W. Cannon", "etype": "article"},
-        {"title": "Editorial: Television in the Home", "author": "Marianne C. Sharp", "etype": "article"},
-        {"title": "Notes to the Field: Relief Society Handbook of Instructions Ready for Distribution", "author": None, "etype": "article"},
-        {"title": "Duplicate Lists of Contributors to Relief Society Building Fund", "author": None, "etype": "article"},
-        {"title": "Table Settings and Flower Arrangements", "author": "Mary Grant Judd", "etype": "article"},
-        {"title": "Glamour Weeds", "author": "Frances Aveson Wiscomb", "etype": "article"},
-        {"title": "Wisteria Blossoms", "author": "Grace Sayre", "etype": "poem"},
-        {"title": "Joanna—Chapter 8", "author": "Margery S. Stewart", "etype": "fiction"},
-        {"title": "Suggestions for a Work Meeting Luncheon", "author": "Christine Eaton", "etype": "article"},
-        {"title": "A Circus is Always Fun", "author": "Rachel K. Laurgaard", "etype": "article"},
-        {"title": "All Serene", "author": "Dorothy J. Roberts", "etype": "poem"},
-        {"title": "Dream", "author": "Edna S. Dustin", "etype": "poem"},
-        {"title": "Notes From the Field", "author": "General Secretary-Treasurer, Margaret C. Pickering", "etype": "article"},
-        {"title": "Theology: Our Lords Ministry in Perea and Judea", "author": "Don B. Colton", "etype": "lesson"},
-        {"title": "Visiting Teacher Messages: Behold, I Stand at the Door and Knock", "author": "Mary Grant Judd", "etype": "lesson"},
-        {"title": "Work Meeting—Sewing: Layettes and Baby Sewing", "author": "Jean Ridges Jennings", "etype": "lesson"},
-        {"title": "Blind and Blues", "author": "Wanda Green Nielson", "etype": "poem"},
-        {"title": "Literature: Legends of Chivalry", "author": "Briant S. Jacobs", "etype": "lesson"},
-        {"title": "Social Science: The Significance of the Declaration of Belief", "author": "G. Homer Durham", "etype": "lesson"},
-        {"title": "Optional Lessons: The Counselors to President Joseph F. Smith", "author": "T. Edgar Lyon", "etype": "lesson"},
-        {"title": "Lullaby", "author": "Jo Adelaide Stock", "etype": "poem"},
-        {"title": "Poem for a Washday", "author": "Miranda Snow Walton", "etype": "poem"},
-        {"title": "From Near and Far", "author": None, "etype": "article"},
-    ],
-
-    ("Vol36", "No09_September_1949"): [
-        {"title": "Vol. 36 SEPTEMBER 1949 No.", "author": None, "etype": "article"},
-        {"title": "Poplar Magic", "author": "Ruth Harwood", "etype": "poem"},
-        {"title": "The Mormon Handicraft Shop", "author": "Ethel C. Smith", "etype": "article"},
-        {"title": "Patchwork Quilts", "author": "Alice Whitson Norton", "etype": "article"},
-        {"title": "Tranquility", "author": "Celia Van Cott", "etype": "poem"},
-        {"title": "Autumn Winds", "author": "Dorothy J. Roberts", "etype": "poem"},
-        {"title": "Relief Society Building News", "author": None, "etype": "article"},
-        {"title": "Autumn", "author": "Margaret B. Shomaker", "etype": "poem"},
-        {"title": "Tempered—Part I", "author": "Gladys I. Hamilton", "etype": "fiction"},
-        {"title": "That He May Know", "author": "LeRoy Burke Meagher", "etype": "poem"},
-        {"title": "Zion National Park", "author": "Willard Luce", "etype": "article"},
-        {"title": "Song", "author": "Sylvia Probst Young", "etype": "poem"},
-        {"title": "Sixty Years Ago", "author": None, "etype": "article"},
-        {"title": "Womans Sphere", "author": "Ramona W. Cannon", "etype": "article"},
-        {"title": "Editorial: Women Who Sew Together", "author": "Vesta P. Crawford", "etype": "article"},
-        {"title": "Notes to the Field: Annual General Relief Society Conference", "author": None, "etype": "article"},
-        {"title": "Buying Textbooks for Relief Society Lessons", "author": None, "etype": "article"},
-        {"title": "The Making and Use of Decorative Candles", "author": "Mary Grant Judd", "etype": "article"},
-        {"title": "The Heart", "author": "Essie M. Robinson", "etype": "poem"},
-        {"title": "Edith Bunn Makes Unique Wagon-Wheel Rugs", "author": "Mirinda Knapp", "etype": "article"},
-        {"title": "Suggestions for a Work Meeting Luncheon", "author": "Christine Eaton", "etype": "article"},
-        {"title": "Wastebaskets Where You Want Them", "author": "Rachel K. Laurgaard", "etype": "article"},
-        {"title": "Marriage", "author": "Grace Sayre", "etype": "poem"},
-        {"title": "Martha, Papoose of the Great Spirit", "author": "James C. Young", "etype": "fiction"},
-        {"title": "Blue Hills", "author": "Helen Gee Woods", "etype": "poem"},
-        {"title": "Joanna—Chapter 9", "author": "Margery S. Stewart", "etype": "fiction"},
-        {"title": "Annual Report—1948", "author": "General Secretary-Treasurer, Margaret C. Pickering", "etype": "article"},
-        {"title": "Reprint of Shakespeares Sonnet 73", "author": None, "etype": "poem"},
-        {"title": "Notes From the Field: Anniversary Parties, Bazaars, and Other Activities", "author": "General Secretary-Treasurer, Margaret C. Pickering", "etype": "article"},
-        {"title": "Theology: Continuation of the Perean and Judean Ministry", "author": "Don B. Colton", "etype": "lesson"},
-        {"title": "Interval", "author": "Evelyn Fjeldsted", "etype": "poem"},
-        {"title": "Visiting Teacher Messages: These Things I Have Spoken Unto You", "author": "Mary Grant Judd", "etype": "lesson"},
-        {"title": "Work Meeting—Sewing: Childrens Clothing", "author": "Jean Ridges Jennings", "etype": "lesson"},
-        {"title": "Literature: The Poet Shakespeare", "author": "Briant S. Jacobs", "etype": "lesson"},
-        {"title": "A Friend Like You", "author": "Hilde Wittemund", "etype": "poem"},
-        {"title": "My Valley", "author": "Jeanette P. Parry", "etype": "poem"},
-        {"title": "From Near and Far", "author": None, "etype": "article"},
-    ],
-
-    ("Vol36", "No10_October_1949"): [
-        {"title": "Vol. 36 OCTOBER 1949 No.", "author": None, "etype": "article"},
-        {"title": "Time for Sorting", "author": "Eva Willes Wangsgaard", "etype": "poem"},
-        {"title": "Making Our Homes More Livable", "author": "Christine H. Robinson", "etype": "article"},
-        {"title": "Veteran", "author": "Christie Lund Coles", "etype": "poem"},
-        {"title": "You Can Learn—Part I—A is for Adult—B is for Bride", "author": "Katherine Kelly", "etype": "fiction"},
-        {"title": "Adoption of Children", "author": "Mary L. Dillman", "etype": "article"},
-        {"title": "Tempered—Part II", "author": "Gladys I. Hamilton", "etype": "fiction"},
-        {"title": "Just Naturally", "author": "Iris W. Schow", "etype": "poem"},
-        {"title": "Sixty Years Ago", "author": None, "etype": "article"},
-        {"title": "Womans Sphere", "author": "Ramona W. Cannon", "etype": "article"},
-        {"title": "Editorial: The Best of Friends", "author": "Marianne C. Sharp", "etype": "article"},
-        {"title": "Notes to the Field: Relief Society Handbook Obtainable Only at Office of General Board", "author": None, "etype": "article"},
-        {"title": "The Interest and Beauty of Fruit", "author": "Mary Grant Judd", "etype": "article"},
-        {"title": "A Halloween Spook Table", "author": "Rachel K. Laurgaard", "etype": "article"},
-        {"title": "Suggestions for a Work Meeting Luncheon", "author": "Christine Eaton", "etype": "article"},
-        {"title": "A Sidewalk Sketch", "author": "Elaine Swain", "etype": "poem"},
-        {"title": "Joanna—Chapter 10", "author": "Margery S. Stewart", "etype": "fiction"},
-        {"title": "Home Safety—a Family Affair", "author": "Nellie O. Parker", "etype": "article"},
-        {"title": "Crocheting Is Her Hobby", "author": None, "etype": "article"},
-        {"title": "October", "author": "Elizabeth Johnson", "etype": "poem"},
-        {"title": "Lets Do Better Embroidery", "author": "Doris Feil", "etype": "article"},
-        {"title": "Notes From the Field: Bazaars, Singing Mothers, Socials, and Other Activities", "author": "General Secretary-Treasurer, Margaret C. Pickering", "etype": "article"},
-        {"title": "Theology: The Perean and Judean Ministry and The Last Winter", "author": "Don B. Colton", "etype": "lesson"},
-        {"title": "Opportunity", "author": "Evelyn Fjeldsted", "etype": "poem"},
-        {"title": "Visiting Teacher Messages: Lovest Thou Me? Feed My Lambs", "author": "Mary Grant Judd", "etype": "lesson"},
-        {"title": "Work Meeting: Underwear and Nightwear", "author": "Jean Ridges Jennings", "etype": "lesson"},
-        {"title": "Literature: The English Bible", "author": "Briant S. Jacobs", "etype": "lesson"},
-        {"title": "Social Science: Governments Instituted for the Benefit of Man", "author": "G. Homer Durham", "etype": "lesson"},
-        {"title": "Against the Years", "author": "Dorothy J. Roberts", "etype": "poem"},
-        {"title": "Optional Lessons in Lieu of Social Science: President Heber J. Grant", "author": "T. Edgar Lyon", "etype": "lesson"},
-        {"title": "Brides Illusion for a Home", "author": "Lael W. Hill", "etype": "poem"},
-        {"title": "From Near and Far", "author": None, "etype": "article"},
-    ],
-
-    ("Vol36", "No11_November_1949"): [
-        {"title": "Vol. 36 NOVEMBER 1949 No.", "author": None, "etype": "article"},
-        {"title": "Rain on November Night", "author": "Marvin Jones", "etype": "poem"},
-        {"title": "Womans Role as Homemaker", "author": "President Belle S. Spafford", "etype": "article"},
-        {"title": "Today Is All of Time", "author": "Maude O. Cook", "etype": "poem"},
-        {"title": "The Loving Friend of Children", "author": "Preston Nibley", "etype": "article"},
-        {"title": "The Pongee Dress", "author": "Grace M. Candland", "etype": "fiction"},
-        {"title": "Alien and Lost", "author": "Dorothy J. Roberts", "etype": "poem"},
-        {"title": "Poem", "author": "Gertrude T. Koven", "etype": "poem"},
-        {"title": "Silence", "author": "Mary Pack Triplett", "etype": "poem"},
-        {"title": "Ancient Rites at a Modern Wedding", "author": "Martha Toronto", "etype": "article"},
-        {"title": "I Saw Palestine", "author": "Ann Rich", "etype": "article"},
-        {"title": "Sixty Years Ago", "author": None, "etype": "article"},
-        {"title": "Womans Sphere", "author": "Ramona W. Cannon", "etype": "article"},
-        {"title": "Editorial: Thanksgiving Without a Feast", "author": "Vesta P. Crawford", "etype": "article"},
-        {"title": "Ascendant Autumn", "author": "Ruth Harwood", "etype": "poem"},
-        {"title": "Earth Decorator", "author": "Christie Lund Coles", "etype": "poem"},
-        {"title": "Suggestions for a Work Meeting Luncheon", "author": "Christine Eaton", "etype": "article"},
-        {"title": "The Long Wait", "author": "Lael W. Hill", "etype": "poem"},
-        {"title": "Joanna—Chapter 11", "author": "Margery S. Stewart", "etype": "fiction"},
-        {"title": "Night", "author": "Gene Romolo", "etype": "poem"},
-        {"title": "Fun With Spools", "author": "Rachel K. Laurgaard", "etype": "article"},
-        {"title": "November Moon", "author": "Margaret B. Shomaker", "etype": "poem"},
-        {"title": "You Can Learn—Part II", "author": "Katherine Kelly", "etype": "fiction"},
-        {"title": "Pioneer Recipe", "author": "Anna Prince Redd", "etype": "article"},
-        {"title": "November Day", "author": "Beatrice K. Ekman", "etype": "poem"},
-        {"title": "The Interest and Beauty of Vegetables", "author": "Mary Grant Judd", "etype": "article"},
-        {"title": "Beauty in Brown", "author": "Josephine J. Harvey", "etype": "poem"},
-        {"title": "A Letter From Mother", "author": "Clara Horne Park", "etype": "article"},
-        {"title": "Notes From the Field: Activities in the Missions, Socials, and Handicraft", "author": "General Secretary-Treasurer, Margaret C. Pickering", "etype": "article"},
-        {"title": "Theology: On to Jerusalem", "author": "Don B. Colton", "etype": "lesson"},
-        {"title": "Visiting Teacher Messages: Is Not the Life More Than Meat?", "author": "Mary Grant Judd", "etype": "lesson"},
-        {"title": "Work Meeting: Girls Clothing", "author": "Jean Ridges Jennings", "etype": "lesson"},
-        {"title": "Star Music", "author": "Grace Sayre", "etype": "poem"},
-        {"title": "Literature: Sir Francis Bacon", "author": "Briant S. Jacobs", "etype": "lesson"},
-        {"title": "Social Science: Public Administration and Good Government", "author": "G. Homer Durham", "etype": "lesson"},
-        {"title": "Optional Lessons: The Counselors to President Heber J. Grant", "author": "T. Edgar Lyon", "etype": "lesson"},
-        {"title": "Thanksgiving Day", "author": "Nan S. Richardson", "etype": "poem"},
-        {"title": "From Near and Far", "author": None, "etype": "article"},
-    ],
-
-    ("Vol36", "No12_December_1949"): [
-        {"title": "Vol. 36 DECEMBER 1949 No.", "author": None, "etype": "article"},
-        {"title": "The Flight", "author": "Dorothy J. Roberts", "etype": "poem"},
-        {"title": "The Prophets Sailing Orders to Relief Society", "author": "President J. Reuben Clark, Jr.", "etype": "article"},
-        {"title": "Joy in Service", "author": "Counselor Marianne C. Sharp", "etype": "article"},
-        {"title": "Introduction to Lesson Courses", "author": "Counselor Marianne C. Sharp", "etype": "article"},
-        {"title": "Relief Society in the Lives of Our Sisters in Europe", "author": "Nida A. Taggart", "etype": "article"},
-        {"title": "Hints on Lesson Development", "author": "Leone O. Jacobs", "etype": "article"},
-        {"title": "Fostering Creative Homemaking Arts", "author": "Leone G. Layton", "etype": "article"},
-        {"title": "With Liberty and Justice for All", "author": "Edith S. Elliott", "etype": "article"},
-        {"title": "Unwashen Hands Versus Hearts", "author": "Spencer W. Kimball", "etype": "article"},
-        {"title": "Report and Official Instructions", "author": "President Belle S. Spafford", "etype": "article"},
-        {"title": "Meeting Our Obligations", "author": "Counselor Velma N. Simonsen", "etype": "article"},
-        {"title": "Joy in Leadership", "author": "Counselor Marianne C. Sharp", "etype": "article"},
-        {"title": "Choose You This Day", "author": "Evon W. Peterson", "etype": "article"},
-        {"title": "Cultivating Lifes Eternal Values", "author": "Mary J. Wilson", "etype": "article"},
-        {"title": "Prepare Thy Heart", "author": "Leone O. Jacobs", "etype": "article"},
-        {"title": "Ready for Christmas", "author": "Ora Pate Stewart", "etype": "fiction"},
-        {"title": "Sixty Years Ago", "author": None, "etype": "article"},
-        {"title": "Womans Sphere", "author": "Ramona W. Cannon", "etype": "article"},
-        {"title": "Editorials: Christmas Down the Years; The 120th Semi-Annual Church Conference; Litter on Temple Square", "author": "Marianne C. Sharp", "etype": "article"},
-        {"title": "Dimensions", "author": "Della Adams Leitner", "etype": "poem"},
-        {"title": "Joanna (Conclusion)", "author": "Margery S. Stewart", "etype": "fiction"},
-        {"title": "Ideas for Christmas Decoration", "author": "Mary Grant Judd", "etype": "article"},
-        {"title": "March Anniversary Work Meeting Luncheon", "author": "Christine Eaton", "etype": "article"},
-        {"title": "The Year Is Done", "author": "Eunice J. Miles", "etype": "poem"},
-        {"title": "A Santa Claus Cookie Box", "author": "Rachel K. Laurgaard", "etype": "article"},
-        {"title": "Auditor", "author": "Grace Sayre", "etype": "poem"},
-        {"title": "An Ever-Burning Christmas Candle", "author": "Rachel K. Laurgaard", "etype": "article"},
-        {"title": "A Letter from Mother", "author": "Clara Horne Park", "etype": "article"},
-        {"title": "Theology: Jesus Returns to the Temple Daily", "author": "Don B. Colton", "etype": "lesson"},
-        {"title": "Visiting Teacher Messages: For This Cause", "author": "Mary Grant Judd", "etype": "lesson"},
-        {"title": "Work Meeting: Boys Clothing", "author": "Jean Ridges Jennings", "etype": "lesson"},
-        {"title": "Literature: John Bunyan", "author": "Briant S. Jacobs", "etype": "lesson"},
-        {"title": "Substitute", "author": "Thelma Ireland", "etype": "poem"},
-        {"title": "Social Science: The Obligations of Citizenship", "author": "G. Homer Durham", "etype": "lesson"},
-        {"title": "Optional Lesson: The Counselors to President Heber J. Grant (Continued)", "author": "T. Edgar Lyon", "etype": "lesson"},
-        {"title": "In This Be Lavish", "author": "Iris W. Schow", "etype": "poem"},
-        {"title": "A Christmas Song", "author": "Irene Storey", "etype": "poem"},
-        {"title": "Holy Night", "author": "Christie Lund Coles", "etype": "poem"},
-        {"title": "Snowflakes", "author": "Elise Maness", "etype": "poem"},
-        {"title": "Remnant", "author": "Marvin Jones", "etype": "poem"},
-        {"title": "From Near and Far", "author": None, "etype": "article"},
-        {"title": "Blizzard", "author": "Evelyn Fjeldsted", "etype": "poem"},
-    ],
-}
+def _freeze_toc(raw_toc: dict) -> types.MappingProxyType:
+    """
+    Check every TOC entry once at load and freeze the table into a
+    read-only mapping of Entry tuples, so extraction never has to re-check
+    entry shape and nothing downstream can mutate it.  Filename stems are
+    sanitized here too, once per title for the whole run.
+    """
+    toc = {}
+    for key, entries in raw_toc.items():
+        frozen = []
+        for entry in entries:
+            if not entry["title"].strip():
+                raise ValueError(f"Empty title in TOC entry for {key}")
+            try:
+                etype = EType[entry["etype"]]
+            except KeyError:
+                raise ValueError(f"Unknown etype {entry['etype']!r} for "
+                                 f"'{entry['title']}' in {key}") from None
+            # Authors and recurring titles repeat across issues; intern
+            # them so every occurrence shares one string object
+            author = entry["author"]
+            if author is not None:
+                author = sys.intern(author)
+            title = sys.intern(entry["title"])
+            frozen.append(Entry(title, author, etype,
+                                sanitize_filename(title)))
+        toc[key] = tuple(frozen)
+    return types.MappingProxyType(toc)
+
+
+@functools.lru_cache(maxsize=1)
+def load_toc() -> types.MappingProxyType:
+    """Import and freeze the Vol 36 TOC on first use."""
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from vol36_toc import VOL36_TOC
+
+    return _freeze_toc(VOL36_TOC)
+
 
 # ---------------------------------------------------------------------------
 # Filename mapping: issue key -> (source filename, month name for output)
 # ---------------------------------------------------------------------------
-ISSUE_FILES = {}
-
-for no in range(1, 13):
-    months_data = [
-        "January", "February", "March", "April", "May", "June",
-        "July", "August", "September", "October", "November", "December"
-    ]
-    month = months_data[no - 1]
-    year = 1949
-
-    key = f"No{no:02d}_{month}_{year}"
-    fname = f"Vol36_{key}.txt"
-    ISSUE_FILES[("Vol36", key)] = (fname, month)
+_MONTHS = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+
+ISSUE_FILES = {
+    ("Vol36", f"No{no:02d}_{month}_1949"): (f"Vol36_No{no:02d}_{month}_1949.txt", month)
+    for no, month in enumerate(_MONTHS, 1)
+}
 
 
 # ---------------------------------------------------------------------------
 # Helper functions
 # ---------------------------------------------------------------------------
 
+# Known section headers from Relief Society Magazine, longest first so that
+# e.g. "SPECIAL FEATURES" wins over "FEATURES"
+_SECTION_NAMES_SORTED = tuple(sorted([
+    "SPECIAL FEATURES", "FICTION", "GENERAL FEATURES", "FEATURES FOR THE HOME",
+    "LESSON DEPARTMENT", "POETRY", "ARTICLES", "REPORTS", "EDITORIAL",
+    "VISITING TEACHERS", "THEOLOGY", "LITERATURE", "SOCIAL SCIENCE",
+    "WORK MEETING", "NOTES FROM THE FIELD", "FEATURES"
+], key=len, reverse=True))
+
+# Alternation tries names in the order above, so the longest still wins
+_SECTION_RE = re.compile(
+    '|'.join(re.escape(name) for name in _SECTION_NAMES_SORTED),
+    re.IGNORECASE,
+)
+
+
 def extract_section_header(text: str) -> tuple[str, str]:
     """
     Extract section header from text that may or may not have spaces around it.
     Handles patterns like "FICTIONCompromise" or "SPECIAL FEATURESTitle".
     Returns (section_header, remaining_text) or (None, text) if no section found.
     """
-    # Known section headers from Relief Society Magazine
-    section_names = [
-        "SPECIAL FEATURES", "FICTION", "GENERAL FEATURES", "FEATURES FOR THE HOME",
-        "LESSON DEPARTMENT", "POETRY", "ARTICLES", "REPORTS", "EDITORIAL",
-        "VISITING TEACHERS", "THEOLOGY", "LITERATURE", "SOCIAL SCIENCE",
-        "WORK MEETING", "NOTES FROM THE FIELD", "FEATURES"
-    ]
-
     text = text.strip()
 
-    # Try to find section headers, checking longest matches first (to handle "SPECIAL FEATURES" before "SPECIAL")
-    for section in sorted(section_names, key=len, reverse=True):
-        # Check for section at start with or without spaces after it
-        if text.upper().startswith(section):
-            remaining = text[len(section):].lstrip()
-            return section, remaining
+    # Only the start of text is examined; no uppercased copy of the whole text
+    match = _SECTION_RE.match(text)
+    if match:
+        return match.group().upper(), text[match.end():].lstrip()
 
     return None, text
 
 
-def build_regex_for_title(title: str) -> re.Pattern:
+@functools.lru_cache(maxsize=4096)
+def build_regex_for_title(title: str, ignore_case: bool = True) -> re.Pattern:
     """Build a flexible regex pattern for matching a title in OCR'd body text.
 
     Handles common OCR artifacts:
@@ -599,6 +226,11 @@ def build_regex_for_title(title: str) -> re.Pattern:
     - Apostrophes/quotes may be dropped or change form
     - Colons may be dropped
     - Whitespace varies (extra spaces, missing spaces at punctuation)
+
+    With ignore_case=False the pattern is case-sensitive, for searching
+    an already lowercased body with a lowercased title.
+
+    Cached, since recurring department titles are rebuilt for every issue.
     """
     parts = []
     i = 0
@@ -623,7 +255,24 @@ def build_regex_for_title(title: str) -> re.Pattern:
         i += 1
 
     pattern = ''.join(parts)
-    return re.compile(pattern, re.IGNORECASE)
+    return re.compile(pattern, re.IGNORECASE if ignore_case else 0)
+
+
+@functools.lru_cache(maxsize=4096)
+def _title_head_pattern(title: str) -> re.Pattern:
+    """
+    Pattern for the flagged-for-review check: the literal title, any
+    whitespace run allowed between words.  Cached per title.
+    """
+    # Escape the words and join them with \s+ in place of each space
+    return re.compile(r'\s+'.join(map(re.escape, title.split(' '))),
+                      re.IGNORECASE)
+
+
+# Page-number lines ("12", "Page 12"), matched across the whole text at once.
+# [^\S\n] keeps the whitespace from running onto neighbouring lines.
+_PAGE_NUMBER_RE = re.compile(r'^(?:Page[^\S\n]+)?\d+[^\S\n]*$',
+                             re.IGNORECASE | re.MULTILINE)
 
 
 def strip_running_noise(text: str) -> tuple[str, list[str]]:
@@ -631,13 +280,13 @@ def strip_running_noise(text: str) -> tuple[str, list[str]]:
     Remove running headers/footers and page numbers.
     Returns (cleaned_text, list_of_noise_fragments).
     """
-    lines = text.split('\n')
+    # Remove page numbers in one pass over the whole text
+    lines = _PAGE_NUMBER_RE.sub('', text).split('\n')
     cleaned = []
     noise = []
 
     for line in lines:
-        # Remove page numbers (usually at start or end of line)
-        line = re.sub(r'^(Page\s+)?(\d+)\s*$', '', line, flags=re.IGNORECASE).strip()
+        line = line.strip()
         # Remove lines that are only headers/footers (short, mostly caps)
         if line and len(line) < 100 and line.isupper():
             noise.append(line)
@@ -647,21 +296,23 @@ def strip_running_noise(text: str) -> tuple[str, list[str]]:
     return '\n'.join(cleaned), noise
 
 
+# Common ads section markers, in priority order: a later marker is only
+# tried when every earlier one is absent, wherever it would match
+_ADS_MARKER_RES = tuple(re.compile(marker, re.IGNORECASE) for marker in (
+    r"ADVERTISING",
+    r"ADVERTISEMENTS",
+    r"FOR SALE",
+    r"BUSINESS",
+))
+
+
 def find_ads_section(body: str) -> str:
     """
     Discover ads text and return it.  Leave body unchanged.
     Returns (ads_text).
     """
-    # Look for common ads section markers
-    ads_markers = [
-        r"ADVERTISING",
-        r"ADVERTISEMENTS",
-        r"FOR SALE",
-        r"BUSINESS",
-    ]
-
-    for marker in ads_markers:
-        match = re.search(marker, body, re.IGNORECASE)
+    for marker_re in _ADS_MARKER_RES:
+        match = marker_re.search(body)
         if match:
             # this kinda sucks because it assumes the ads are the end but meh
             return body[match.start():]
@@ -669,21 +320,22 @@ def find_ads_section(body: str) -> str:
     return ""
 
 
+# Markers ending the front matter, full form first, then OCR-truncated forms
+_FRONT_MATTER_END_RES = tuple(re.compile(marker, re.IGNORECASE) for marker in (
+    "PUBLISHED MONTHLY BY THE GENERAL BOARD",
+    "ISHED MONTHLY BY THE GENERAL BOARD",
+    "MONTHLY BY THE GENERAL BOARD",
+))
+
+
 def split_front_matter(text: str) -> tuple[str, str]:
     """
     Split text into front matter (TOC, etc.) and body.
     Looks for "PUBLISHED MONTHLY BY THE GENERAL BOARD" marker which ends front matter.
     """
-
-    toc_end_markers = [
-        "PUBLISHED MONTHLY BY THE GENERAL BOARD",
-        "ISHED MONTHLY BY THE GENERAL BOARD",
-        "MONTHLY BY THE GENERAL BOARD"
-    ]
-
     split_point = -1
-    for marker in toc_end_markers:
-        match = re.search(marker, text, re.IGNORECASE)
+    for marker_re in _FRONT_MATTER_END_RES:
+        match = marker_re.search(text)
         if match:
             split_point = match.start()
             front_matter = text[:split_point]
@@ -695,16 +347,27 @@ def split_front_matter(text: str) -> tuple[str, str]:
         raise Exception("Unable to find 'PUBLISHED MONTHLY BY THE GENERAL BOARD' (case sensitive) and so couldn't split text.")
 
 
-def _match_entries_with_strategy(body: str, entries: list[dict]) -> list[tuple[int, dict]]:
+def _match_entries_with_strategy(body: str, entries: tuple[Entry, ...]) -> list[tuple[int, Entry]]:
     """
     Match all entries in the body.
-    Returns list of (position, entry_dict) tuples.
+    Returns list of (position, entry) tuples.
     """
     found = []
 
+    # Lowercase the body once and search it case-sensitively: IGNORECASE
+    # makes the regex engine fold every character it compares, and rules
+    # out its fast literal scan.  A few characters (e.g. "\u0130") lowercase
+    # to two, which would shift positions; fall back to IGNORECASE then.
+    body_lower = body.lower()
+    fold = len(body_lower) == len(body)
+
     for entry in entries:
-        pattern = build_regex_for_title(entry["title"])
-        match = pattern.search(body)
+        if fold:
+            pattern = build_regex_for_title(entry.title.lower(), ignore_case=False)
+            match = pattern.search(body_lower)
+        else:
+            pattern = build_regex_for_title(entry.title)
+            match = pattern.search(body)
 
         if match:
             found.append((match.start(), entry))
@@ -712,7 +375,7 @@ def _match_entries_with_strategy(body: str, entries: list[dict]) -> list[tuple[i
     return found
 
 
-def _boundaries_from_found(body: str, found: list[tuple[int, dict]]) -> list[tuple[int, int, dict]]:
+def _boundaries_from_found(body: str, found: list[tuple[int, Entry]]) -> list[tuple[int, int, Entry]]:
     """
     Convert (position, entry) list into (start, end, entry) boundaries.
     Each entry's text extends from its match to the next entry's match.
@@ -732,47 +395,94 @@ def _boundaries_from_found(body: str, found: list[tuple[int, dict]]) -> list[tup
     return bounds
 
 
+# First through last non-whitespace character of a span
+_STRIPPED_SPAN_RE = re.compile(r'\S(?:.*\S)?', re.DOTALL)
+
+
+def _stripped_slice(text: str, start: int, end: int) -> str:
+    """
+    Equivalent to text[start:end].strip(), but the regex engine finds the
+    stripped bounds in place so only the final string is allocated.
+    """
+    match = _STRIPPED_SPAN_RE.search(text, start, end)
+    return match.group() if match else ""
+
+
+# "Contents" heading that opens the TOC
+_TOC_START_RE = re.compile(r'contents', re.IGNORECASE)
+# Where the TOC ends: the publisher line (possibly OCR-truncated) or a line
+# starting with a "Page N" marker
+_TOC_END_RE = re.compile(
+    r'(?:PUBL)?ISHED MONTHLY BY THE GENERAL BOARD|MONTHLY BY THE GENERAL BOARD'
+    r'|^[^\S\n]*Page\s+\d+',
+    re.IGNORECASE | re.MULTILINE)
+
+
 def extract_toc_from_front_matter(front_matter: str) -> tuple[str, str]:
     """
     Extract TOC section from front matter.
-    Returns (toc_text, remaining_front_matter).
+    Returns (toc_text, remaining_front_matter), where the remainder is
+    the front matter before and after the TOC.
     """
     # Look for "Contents" markers
-    toc_start = front_matter.lower().find("contents")
-    if toc_start == -1:
+    start_match = _TOC_START_RE.search(front_matter)
+    if not start_match:
         return "", front_matter
+    toc_start = start_match.start()
 
-    # Find the next major section that's not part of TOC
-    # (usually the first actual article or "PUBLISHED MONTHLY BY...")
-    toc_text = front_matter[toc_start:]
-    remaining = front_matter[:toc_start]
-
-    # Try to find where TOC ends
-    # use raw strings e.g. r""
-    # that way it's explicit that the backslashes belong to regex
-    # and not python's string parser
-    toc_end_markers = [
-        "PUBLISHED MONTHLY BY THE GENERAL BOARD",
-        "ISHED MONTHLY BY THE GENERAL BOARD",
-        "MONTHLY BY THE GENERAL BOARD",
-        r"^[Page\s]*\d+"
-    ]
-    for marker in toc_end_markers:
-        match = re.search(marker, toc_text, re.IGNORECASE)
-        if match:
-            toc_text = toc_text[:match.start()]
-            remaining += toc_text
-            break
+    # Find where the TOC ends, searching only past its heading
+    end_match = _TOC_END_RE.search(front_matter, start_match.end())
+    toc_end = end_match.start() if end_match else len(front_matter)
 
+    toc_text = front_matter[toc_start:toc_end]
+    remaining = front_matter[:toc_start] + front_matter[toc_end:]
     return toc_text.strip(), remaining.strip()
 
 
-def extract_issue(text: str, entries: list[dict], vol: str, month: str,
+# Same flags and permissions open(path, "wb") would use
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def _write_bytes(dir_path: str, filename: str, data: bytes) -> None:
+    """
+    Write one pre-encoded output file into an existing directory.  Goes
+    straight to the file descriptor, since a buffered file object would
+    only copy data once more before the write.
+    """
+    fd = os.open(os.path.join(dir_path, filename), _WRITE_FLAGS, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _write_files(dir_path: str, files: list[tuple[str, bytes]]) -> None:
+    """
+    Write a batch of (filename, utf-8 data) output files into an existing
+    directory.  Threads overlap the per-file open/write/close latency.
+    """
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        # list() so any write error is raised here
+        list(executor.map(lambda f: _write_bytes(dir_path, *f), files))
+
+
+def extract_issue(text: str, entries: tuple[Entry, ...], vol: str, month: str,
                   source_filename: str, output_dir: Path,
-                  dry_run: bool = False) -> dict:
+                  dry_run: bool = False,
+                  source_bytes: int | None = None,
+                  embed_content: bool = True,
+                  verbose: bool = False) -> dict:
     """
     Extract a single issue's text into individual entry files.
-    Returns a dict with stats, manifest_rows, and a month_json object.
+    The output directory output_dir/vol/month must already exist.
+    source_bytes is the size of the file text was read from; when omitted
+    it is measured by re-encoding text.  With embed_content=False, matched
+    entries carry only the file reference, not their text.  Per-entry
+    match lines are only printed when verbose is set.
+    Returns a dict with stats, manifest_rows, flagged (entries whose
+    content does not start with their title), and a month_json object.
     """
     # Split off front matter so title matches happen in body only
     front_matter, body = split_front_matter(text)
@@ -784,104 +494,114 @@ def extract_issue(text: str, entries: list[dict], vol: str, month: str,
     found = _match_entries_with_strategy(body, entries)
     bounds = _boundaries_from_found(body, found)
 
-    # Build lookup dict: title -> (start, end)
-    by_title = {e["title"]: (s, nd) for s, nd, e in bounds}
+    if source_bytes is None:
+        source_bytes = len(text.encode("utf-8"))
 
     stats = {"matched": 0, "misc_bytes": 0,
-             "total_bytes": len(text.encode("utf-8")),
-             "manifest_rows": []}
+             "total_bytes": source_bytes,
+             "manifest_rows": [], "flagged": []}
 
-    issue_dir = output_dir / vol / month
+    # Plain string path: main() has already created the directory
+    issue_dir = os.path.join(output_dir, vol, month)
     rel_dir = f"processed/{vol}/{month}"
-    if not dry_run:
-        issue_dir.mkdir(parents=True, exist_ok=True)
+    # Output files are encoded once and written together once the issue
+    # is extracted
+    pending_writes = []
 
     # Collect all noise stripped from articles for MISC
     all_noise = []
-    # Track covered intervals (union of strict and loose)
-    covered_intervals = []
     # JSON entries for this month
     json_entries = []
 
-    # Ordering for index numbering
-    title_order = [e["title"] for _, _, e in bounds]
+    # Every boundary is a matched entry, numbered in body order
+    for idx, (start, end, entry) in enumerate(bounds, 1):
+        # Per-entry fields shared by the JSON entry, manifest row and flag
+        title = entry.title
+        author = entry.author
+        etype = entry.etype.name
+        title_safe = entry.filename_stem
 
-    # Build entry lookup by title for metadata
-    entry_by_title = {e["title"]: e for e in entries}
-
-    for idx, title in enumerate(title_order, 1):
-        entry = entry_by_title.get(title)
-        if not entry:
-            continue
+        # Process match
+        raw_text = _stripped_slice(body, start, end)
+        raw_len = len(raw_text)
+        cleaned, noise_frags = strip_running_noise(raw_text)
+        cleaned = cleaned.strip()
+        all_noise.extend(noise_frags)
+
+        filename = f"{idx:02d}_{title_safe}.txt"
+        if not dry_run and cleaned:
+            pending_writes.append((filename, cleaned.encode("utf-8")))
+
+        match_result = {
+            "file": filename,
+            "path": rel_dir,
+            "position": start,
+            "length": raw_len,
+        }
+        if embed_content:
+            match_result["content"] = cleaned
 
-        title_safe = sanitize_filename(entry["title"])
+        stats["matched"] += 1
 
-        # Process match
-        match_result = None
-        if title in by_title:
-            start, end = by_title[title]
-            raw_text = body[start:end].strip()
-            raw_len = len(raw_text)
-            cleaned, noise_frags = strip_running_noise(raw_text)
-            cleaned = cleaned.strip()
-            all_noise.extend(noise_frags)
-            covered_intervals.append((start, end))
-
-            filename = f"{idx:02d}_{title_safe}.txt"
-            if not dry_run and cleaned:
-                (issue_dir / filename).write_text(cleaned, encoding="utf-8")
-
-            match_result = {
+        json_entry = {
+            "index": idx,
+            "title": title,
+            "author": author,
+            "etype": etype,
+            "match": match_result,
+        }
+        json_entries.append(json_entry)
+
+        # Manifest row
+        stats["manifest_rows"].append((
+            filename, rel_dir, vol, month,
+            etype, title, author, "match",
+        ))
+
+        # Flag entries whose content does not start with their own
+        # title, indicating a likely false split where the title was
+        # matched mid-sentence in a preceding article's body text.
+        # Checked here, while the content is at hand even when it is
+        # not embedded in the JSON.
+        # Check if the title appears near the start
+        # (first 200 chars to allow for minor leading whitespace)
+        head = cleaned[:200]
+        if not _title_head_pattern(title).search(head):
+            flagged_entry = {
+                "title": title,
+                "author": author,
+                "etype": etype,
+                "index": idx,
+                "month": month,
                 "file": filename,
                 "path": rel_dir,
                 "position": start,
                 "length": raw_len,
-                "content": cleaned,
             }
+            if embed_content:
+                flagged_entry["content"] = cleaned
+            flagged_entry["title_not_at_start"] = True
+            stats["flagged"].append(flagged_entry)
 
-        if match_result:
-            stats["matched"] += 1
-
-            json_entry = {
-                "index": idx,
-                "title": entry["title"],
-                "author": entry["author"],
-                "etype": entry["etype"],
-                "match": match_result,
-            }
-            json_entries.append(json_entry)
-
-            # Manifest row
-            stats["manifest_rows"].append({
-                "file": match_result["file"],
-                "path": rel_dir,
-                "volume": vol,
-                "month": month,
-                "etype": entry["etype"],
-                "title": entry["title"],
-                "author": entry["author"],
-                "strategy": "match",
-            })
-
-            # Verbose output
+        # Verbose output
+        if verbose:
             matched_label = "matched"
-            chars = len(match_result["content"])
+            chars = len(cleaned)
             print(f"  [{matched_label:12s}] #{idx:02d} "
                   f"chars={chars} "
-                  f"{entry['title'][:50]}")
-        else:
-            print(f"  WARNING: No match for '{entry['title']}' in body text")
+                  f"{title[:50]}")
 
     # Report unmatched TOC entries
-    matched_titles = {e["title"] for e in entries}
+    matched_titles = {e.title for e in entries}
     toc_matched = {e["title"] for e in json_entries}
     unmatched = matched_titles - toc_matched
 
     if unmatched:
         print(f"\n  TOC entries NOT found in body ({len(unmatched)}):")
         for title in sorted(unmatched):
-            toc_entry = next((e for e in entries if e["title"] == title), {})
-            print(f"    - {title} ({toc_entry.get('etype', '?')})")
+            toc_entry = next((e for e in entries if e.title == title), None)
+            etype = toc_entry.etype.name if toc_entry else "?"
+            print(f"    - {title} ({etype})")
     else:
         print(f"\n  ✓ All {len(matched_titles)} TOC entries matched in body")
 
@@ -892,36 +612,30 @@ def extract_issue(text: str, entries: list[dict], vol: str, month: str,
     if toc_text:
         toc_filename = "TOC.txt"
         if not dry_run:
-            (issue_dir / toc_filename).write_text(toc_text, encoding="utf-8")
+            pending_writes.append((toc_filename, toc_text.encode("utf-8")))
         toc_json = {
             "file": toc_filename,
             "path": rel_dir,
             "content": toc_text,
         }
-        stats["manifest_rows"].append({
-            "file": toc_filename, "path": rel_dir,
-            "volume": vol, "month": month,
-            "etype": "toc", "title": "TOC",
-            "author": "", "strategy": "",
-        })
+        stats["manifest_rows"].append((
+            toc_filename, rel_dir, vol, month, "toc", "TOC", "", "",
+        ))
 
     # Write ads file
     ads_json = None
     if ads_text:
         ads_filename = "ADS.txt"
         if not dry_run:
-            (issue_dir / ads_filename).write_text(ads_text, encoding="utf-8")
+            pending_writes.append((ads_filename, ads_text.encode("utf-8")))
         ads_json = {
             "file": ads_filename,
             "path": rel_dir,
             "content": ads_text,
         }
-        stats["manifest_rows"].append({
-            "file": ads_filename, "path": rel_dir,
-            "volume": vol, "month": month,
-            "etype": "ads", "title": "ADS",
-            "author": "", "strategy": "",
-        })
+        stats["manifest_rows"].append((
+            ads_filename, rel_dir, vol, month, "ads", "ADS", "", "",
+        ))
 
     # Collect uncovered text into MISC
     misc_parts = []
@@ -930,51 +644,49 @@ def extract_issue(text: str, entries: list[dict], vol: str, month: str,
     if remaining_fm.strip():
         misc_parts.append(remaining_fm.strip())
 
-    # Find gaps in body not covered by any entry (using union of intervals)
-    all_intervals = sorted(set(covered_intervals))
+    # Find gaps in body not covered by any entry.  bounds is sorted and
+    # each entry ends where the next begins, so it needs no merging.
     cursor = 0
-    for iv_start, iv_end in all_intervals:
+    for iv_start, iv_end, _ in bounds:
         if cursor < iv_start:
-            gap_text = body[cursor:iv_start].strip()
+            gap_text = _stripped_slice(body, cursor, iv_start)
             if gap_text:
                 misc_parts.append(gap_text)
-        cursor = max(cursor, iv_end)
+        cursor = iv_end
 
     if cursor < len(body):
-        gap_text = body[cursor:].strip()
+        gap_text = _stripped_slice(body, cursor, len(body))
         if gap_text:
             misc_parts.append(gap_text)
 
     # Stripped noise goes into MISC
     if all_noise:
         misc_parts.append("--- STRIPPED NOISE ---")
-        # Deduplicate noise fragments
-        seen = set()
-        for frag in all_noise:
-            if frag not in seen:
-                seen.add(frag)
-                misc_parts.append(frag)
+        # Deduplicate noise fragments, keeping first-seen order
+        misc_parts.extend(dict.fromkeys(all_noise))
 
     misc_json = None
     if misc_parts:
         misc_text = "\n\n---\n\n".join(misc_parts)
-        stats["misc_bytes"] = len(misc_text.encode("utf-8"))
+        # Encode once: the same bytes give the size and get written
+        misc_data = misc_text.encode("utf-8")
+        stats["misc_bytes"] = len(misc_data)
         misc_filename = "MISC.txt"
 
         if not dry_run:
-            (issue_dir / misc_filename).write_text(misc_text, encoding="utf-8")
+            pending_writes.append((misc_filename, misc_data))
 
         misc_json = {
             "file": misc_filename,
             "path": rel_dir,
             "content": misc_text,
         }
-        stats["manifest_rows"].append({
-            "file": misc_filename, "path": rel_dir,
-            "volume": vol, "month": month,
-            "etype": "misc", "title": "MISC",
-            "author": "", "strategy": "",
-        })
+        stats["manifest_rows"].append((
+            misc_filename, rel_dir, vol, month, "misc", "MISC", "", "",
+        ))
+
+    if not dry_run:
+        _write_files(issue_dir, pending_writes)
 
     # Build month JSON object
     source_rel_path = f"cleaned-data/relief-society/txtvolumesbymonth/{vol}"
@@ -990,6 +702,90 @@ def extract_issue(text: str, entries: list[dict], vol: str, month: str,
     return stats
 
 
+def _read_source(path: Path) -> tuple[str, int]:
+    """
+    Read a source issue file.  Decodes straight out of a read-only memory
+    map, so the file contents are never copied into an intermediate bytes
+    object before decoding.  Line endings are normalized to "\n" the way
+    Path.read_text() does, since files written on Windows use CRLF; the
+    size is still that of the file on disk.
+    Returns (text, size_in_bytes).
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return "", 0  # mmap cannot map an empty file
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            text = str(mm, "utf-8", "replace")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text, size
+
+
+def _dumps_json(data) -> bytes:
+    """
+    Serialize data as indented UTF-8 JSON.  Uses orjson when it is
+    installed, which serializes straight to bytes; otherwise falls back to
+    json.dumps with the same formatting.
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False,
+                      default=str).encode("utf-8")
+
+
+def _write_json(path: Path, data) -> None:
+    """
+    Write data as indented UTF-8 JSON, serialized in full first so the
+    file gets a single write rather than one per json.dump() chunk.
+    """
+    path.write_bytes(_dumps_json(data))
+
+
+def _write_volume_json(path: Path, volume: str, months: dict) -> None:
+    """
+    Write a {"volume": ..., "months": {...}} document one month at a time,
+    so only a single month's serialized text is held in memory at once.
+    The output is byte-identical to _dumps_json() on the whole document:
+    each month is re-indented to its nesting depth, which is safe because
+    JSON strings never contain a raw newline.
+    """
+    with open(path, "wb") as f:
+        f.write(b'{\n  "volume": ' + _dumps_json(volume) + b',\n  "months": ')
+        if not months:
+            f.write(b"{}\n}")
+            return
+        sep = b"{\n    "
+        for month, month_data in months.items():
+            f.write(sep)
+            f.write(_dumps_json(month) + b": ")
+            f.write(_dumps_json(month_data).replace(b"\n", b"\n    "))
+            sep = b",\n    "
+        f.write(b"\n  }\n}")
+
+
+def process_issue(task: tuple) -> tuple[str, str, str, dict, str]:
+    """
+    Read and extract a single issue.  Runs in a worker process, so the
+    per-issue log is captured and handed back for the parent to print in
+    issue order.
+    Returns (vol, month, source_filename, stats, log).
+    """
+    (source_path, entries, vol, month, filename, output_dir, dry_run,
+     embed_content, verbose) = task
+
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        text, source_bytes = _read_source(source_path)
+        stats = extract_issue(text, entries, vol.lower(), month, filename,
+                              output_dir, dry_run=dry_run,
+                              source_bytes=source_bytes,
+                              embed_content=embed_content,
+                              verbose=verbose)
+
+    return vol, month, filename, stats, log.getvalue()
+
+
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
@@ -1001,7 +797,16 @@ def main():
                         help="Show what would be written without creating files")
     parser.add_argument("--use-raw-data", action="store_true",
                         help="Use raw-data instead of cleaned-data")
+    parser.add_argument("--omit-content", action="store_true",
+                        help="Leave entry text out of the JSON output "
+                             "(it is still written to the .txt files)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Number of worker processes (default: CPU count)")
+    parser.add_argument("--verbose", action="store_true",
+                        help="Print a line for every matched entry")
     args = parser.parse_args()
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
 
     # Set data directory based on flag
     if args.use_raw_data:
@@ -1019,8 +824,15 @@ def main():
 
     # Collect JSON data per volume: { "Vol36": {"volume": ..., "months": {...}} }
     volume_json = {}
-
-    for (vol, issue_key), entries in VOL36_TOC.items():
+    # Entries flagged for review per volume, in issue order
+    flagged_by_vol = {}
+
+    # Resolve source files up front; the extraction itself runs per issue
+    # in worker processes since issues share no state.
+    tasks = []
+    # Lowercase name -> subdirectory of data_dir, listed on the first miss only
+    vol_dirs = None
+    for (vol, issue_key), entries in load_toc().items():
         if (vol, issue_key) not in ISSUE_FILES:
             print(f"WARNING: No file mapping for ({vol}, {issue_key}), skipping")
             continue
@@ -1030,41 +842,62 @@ def main():
 
         if not source_path.exists():
             # Try case variations
-            for candidate in data_dir.iterdir():
-                if candidate.name.lower() == vol.lower():
-                    source_path = candidate / filename
-                    break
+            if vol_dirs is None:
+                vol_dirs = {}
+                # DirEntry.is_dir() answers from the listing itself on
+                # most platforms, without a stat() per entry
+                with os.scandir(data_dir) as it:
+                    for candidate in it:
+                        if candidate.is_dir():
+                            vol_dirs.setdefault(candidate.name.lower(),
+                                                candidate.path)
+            candidate = vol_dirs.get(vol.lower())
+            if candidate is not None:
+                source_path = Path(candidate, filename)
 
         if not source_path.exists():
             print(f"WARNING: Source file not found: {source_path}")
             continue
 
-        print(f"\n{'='*60}")
-        print(f"Processing: {vol} / {month} ({filename})")
-        print(f"{'='*60}")
+        tasks.append((source_path, entries, vol, month, filename,
+                      OUTPUT_DIR, args.dry_run, not args.omit_content,
+                      args.verbose))
 
-        text = source_path.read_text(encoding="utf-8", errors="replace")
-
-        out_vol = vol.lower()
-        stats = extract_issue(text, entries, out_vol, month, filename,
-                              OUTPUT_DIR, dry_run=args.dry_run)
-
-        issues_processed += 1
-        total_matched += stats["matched"]
-        total_misc += stats["misc_bytes"]
-        total_bytes += stats["total_bytes"]
-        all_manifest_rows.extend(stats["manifest_rows"])
-
-        # Accumulate into volume JSON
-        if out_vol not in volume_json:
-            volume_json[out_vol] = {"volume": out_vol, "months": {}}
-        volume_json[out_vol]["months"][month] = stats["month_json"]
-
-        coverage = ((stats["total_bytes"] - stats["misc_bytes"]) / stats["total_bytes"] * 100
-                     if stats["total_bytes"] > 0 else 0)
-        print(f"  Entries matched: {stats['matched']}")
-        print(f"  Coverage: {coverage:.1f}%")
-        print(f"  Misc bytes: {stats['misc_bytes']}")
+    # Create every issue directory once, before any worker writes to it
+    if not args.dry_run:
+        for _, _, vol, month, *_ in tasks:
+            os.makedirs(OUTPUT_DIR / vol.lower() / month, exist_ok=True)
+
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        # map() yields in submission order, so output stays deterministic
+        for vol, month, filename, stats, log in executor.map(process_issue, tasks):
+            print(f"\n{'='*60}")
+            print(f"Processing: {vol} / {month} ({filename})")
+            print(f"{'='*60}")
+            print(log, end="")
+
+            out_vol = vol.lower()
+            matched = stats["matched"]
+            misc_bytes = stats["misc_bytes"]
+            issue_bytes = stats["total_bytes"]
+
+            issues_processed += 1
+            total_matched += matched
+            total_misc += misc_bytes
+            total_bytes += issue_bytes
+            all_manifest_rows.extend(stats["manifest_rows"])
+
+            # Accumulate into volume JSON
+            if out_vol not in volume_json:
+                volume_json[out_vol] = {"volume": out_vol, "months": {}}
+            volume_json[out_vol]["months"][month] = stats["month_json"]
+            flagged_by_vol.setdefault(out_vol, []).extend(stats["flagged"])
+
+            coverage = ((issue_bytes - misc_bytes) / issue_bytes * 100
+                         if issue_bytes > 0 else 0)
+            print(f"  Entries matched: {matched}")
+            print(f"  Coverage: {coverage:.1f}%")
+            print(f"  Misc bytes: {misc_bytes}")
 
     # Write per-volume JSON files and flagged_for_review.json
     if not args.dry_run:
@@ -1073,59 +906,25 @@ def main():
             vol_dir.mkdir(parents=True, exist_ok=True)
 
             json_path = vol_dir / f"{vol}_entries.json"
-            with open(json_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+            _write_volume_json(json_path, data["volume"], data["months"])
             print(f"\nJSON written: {json_path}")
 
-            # Build flagged_for_review.json — entries whose content does
-            # not start with their own title, indicating a likely false
-            # split where the title was matched mid-sentence in a
-            # preceding article's body text.
-            flagged = []
-            for month_name, month_data in data["months"].items():
-                for entry_json in month_data["entries"]:
-                    title = entry_json["title"]
-                    title_pat = re.compile(
-                        re.sub(r'\s+', r'\\s+', re.escape(title)),
-                        re.IGNORECASE,
-                    )
-                    match_data = entry_json.get("match")
-                    if match_data is None:
-                        continue
-                    content = match_data["content"]
-                    # Check if the title appears near the start
-                    # (first 200 chars to allow for minor leading whitespace)
-                    head = content[:200] if content else ""
-                    if not title_pat.search(head):
-                        flagged.append({
-                            "title": title,
-                            "author": entry_json["author"],
-                            "etype": entry_json["etype"],
-                            "index": entry_json["index"],
-                            "month": month_name,
-                            "file": match_data["file"],
-                            "path": match_data["path"],
-                            "position": match_data["position"],
-                            "length": match_data["length"],
-                            "content": content,
-                            "title_not_at_start": True,
-                        })
-
+            # Entries whose content does not start with their own title
+            # (collected per issue by extract_issue)
+            flagged = flagged_by_vol[vol]
             if flagged:
                 flagged_path = vol_dir / "flagged_for_review.json"
-                with open(flagged_path, "w", encoding="utf-8") as f:
-                    json.dump(flagged, f, indent=2, ensure_ascii=False, default=str)
+                _write_json(flagged_path, flagged)
                 print(f"Flagged for review: {flagged_path} "
                       f"({len(flagged)} entries with title not at start)")
 
     # Write manifest CSV
     if all_manifest_rows and not args.dry_run:
         manifest_path = OUTPUT_DIR / "manifest.csv"
-        fieldnames = ["file", "path", "volume", "month", "etype",
-                      "title", "author", "strategy"]
-        with open(manifest_path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
+        with open(manifest_path, "w", newline="", encoding="utf-8",
+                  buffering=1 << 20) as f:
+            writer = csv.writer(f)
+            writer.writerow(MANIFEST_FIELDS)
             writer.writerows(all_manifest_rows)
         print(f"Manifest written: {manifest_path} ({len(all_manifest_rows)} entries)")
 
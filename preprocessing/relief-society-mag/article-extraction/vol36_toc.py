@@ -0,0 +1,489 @@
+#!/usr/bin/env python3
+"""
+Table of Contents for Relief Society Magazine Volume 36 (1949).
+
+Extracted from the CONTENTS sections at the top of each monthly issue file.
+
+Format: VOL36_TOC[(volume, issue_key)] = [entry_list]
+Issue keys match the source filename pattern.  Entries are in the order they
+appear in the magazine.
+Each entry has:
+  - title: the title as it appears in the text (used for regex matching)
+  - author: author name if listed, else None
+  - etype: "article", "poem", "lesson", "fiction"
+"""
+
+VOL36_TOC = {
+    ("Vol36", "No01_January_1949"): [
+        {"title": "January Snow", "author": "Eva Willes Wangsgaard", "etype": "poem"},
+        {"title": "New Year Greetings", "author": "General Presidency of Relief Society", "etype": "article"},
+        {"title": "The Modern Family and Spirituality", "author": "Achsa E. Paxman", "etype": "article"},
+        {"title": "Award Winners—Eliza R. Snow Poem Contest", "author": None, "etype": "article"},
+        {"title": "Profile of Joseph—First Prize Poem", "author": "Dorothy J. Roberts", "etype": "article"},
+        {"title": "Another Mary—Second Prize Poem", "author": "Miranda Snow Walton", "etype": "article"},
+        {"title": "Infant Daughter of...—Third Prize Poem", "author": "Alice M. Burnett", "etype": "article"},
+        {"title": "Award Winners—Annual Relief Society Story Contest", "author": None, "etype": "article"},
+        {"title": "The Hurrahs Nest—First Prize Story", "author": "Estelle Webb Thomas", "etype": "article"},
+        {"title": "President Belle S. Spafford Elected to Office in the National Council", "author": "Priscilla L. Evans", "etype": "article"},
+        {"title": "Artist", "author": "Gene Romolo", "etype": "poem"},
+        {"title": "Relief Society Building News", "author": None, "etype": "article"},
+        {"title": "Give Love", "author": "Gertrude T. Koven", "etype": "poem"},
+        {"title": "Joanna—Chapter 1", "author": "Margery S. Stewart", "etype": "fiction"},
+        {"title": "Sixty Years Ago", "author": None, "etype": "article"},
+        {"title": "Womans Sphere", "author": "Ramona W. Cannon", "etype": "article"},
+        {"title": "Editorial: Renascence 1949", "author": "Marianne C. Sharp", "etype": "article"},
+        {"title": "Notes to the Field", "author": None, "etype": "article"},
+        {"title": "Quick and Easy Dinners", "author": "Sara Mills", "etype": "article"},
+        {"title": "Be Swell", "author": "Julene J. Cushing", "etype": "poem"},
+        {"title": "The Dress—Part I", "author": "Fay Tarlock", "etype": "fiction"},
+        {"title": "How to Make a Kapok Quilt", "author": "Ilean H. Poulson", "etype": "article"},
+        {"title": "Once Remembered", "author": "Wanda Greene Nielson", "etype": "poem"},
+        {"title": "Notes From the Field: Handicraft, Sewing, and Other Activities", "author": None, "etype": "article"},
+        {"title": "The Conductor and the Accompanist", "author": "Florence Jepperson Madsen", "etype": "article"},
+        {"title": "All in a Days Pleasure", "author": "Helen Martin", "etype": "article"},
+        {"title": "Where White Lilies Grow", "author": "Elsie Chamberlain Carroll", "etype": "poem"},
+        {"title": "On Waking", "author": "Christie Lund Coles", "etype": "poem"},
+        {"title": "Theology: The Transfiguration", "author": "Elder Don B. Colton", "etype": "lesson"},
+        {"title": "Work Meeting—Sewing: Use Your Odds and Ends", "author": "Jean Ridges Jennings", "etype": "lesson"},
+        {"title": "Literature: Literary Sidelights of the Founding Years", "author": "Elder Howard R. Driggs", "etype": "lesson"},
+        {"title": "Visiting Teachers Messages: I Will Not Leave You Comfortless", "author": "Elder H. Wayne Driggs", "etype": "lesson"},
+        {"title": "From a Hospital Window", "author": "Evelyn Fjeldsted", "etype": "poem"},
+        {"title": "To a Seeing-Eye Dog", "author": "Marvin Jones", "etype": "poem"},
+        {"title": "Social Science: Contemporary Domestic Problems", "author": "Elder G. Homer Durham", "etype": "lesson"},
+        {"title": "Be Still and Know", "author": "Beatrice K. Ekman", "etype": "poem"},
+        {"title": "Optional Lessons in Lieu of Social Science: The Presidency of Wilford Woodruff", "author": "Elder T. Edgar Lyon", "etype": "lesson"},
+        {"title": "Prayer", "author": "Gladys I. Hamilton", "etype": "poem"},
+        {"title": "Do Hearts Grow?", "author": "Josephine J. Harvey", "etype": "poem"},
+        {"title": "Lyric of Being", "author": "Ruth Harwood", "etype": "poem"},
+        {"title": "From Near and Far", "author": None, "etype": "article"},
+    ],
+
+    ("Vol36", "No02_February_1949"): [
+        {"title": "Unwritten Song", "author": "Anna Prince Redd", "etype": "poem"},
+        {"title": "A Memorial to the Relief Society Sisters", "author": "Lydia M. Tanner", "etype": "article"},
+        {"title": "Relief Society Building News", "author": None, "etype": "article"},
+        {"title": "Heart-Deep in Winter", "author": "Eva Willes Wangsgaard", "etype": "poem"},
+        {"title": "They Die in the Harness—Second Prize Story", "author": "Myrtle M. Dean", "etype": "fiction"},
+        {"title": "Violin", "author": "Susa Gould Walker", "etype": "poem"},
+        {"title": "Remuneration", "author": "Alice Whitson Norton", "etype": "poem"},
+        {"title": "The Symbol of a Dream", "author": "Verda Mae Fuller", "etype": "article"},
+        {"title": "From the Shadow of a Dream to the Sunlight of Promise", "author": "Vesta P. Crawford", "etype": "article"},
+        {"title": "Women Against Polio", "author": "Caroline Eyring Miner", "etype": "article"},
+        {"title": "Sixty Years Ago", "author": None, "etype": "article"},
+        {"title": "Womans Sphere", "author": "Ramona W. Cannon", "etype": "article"},
+        {"title": "Editorial: Remembrance for February", "author": "Vesta P. Crawford", "etype": "article"},
+        {"title": "Congratulations to President Amy Brown Lyman on Her Birthday", "author": None, "etype": "article"},
+        {"title": "Take What You Can", "author": "Christie Lund Coles", "etype": "poem"},
+        {"title": "The Sane View", "author": "Elaine Whitelaw", "etype": "article"},
+        {"title": "Winter Peace", "author": "Dorothy J. Roberts", "etype": "poem"},
+        {"title": "Joanna—Chapter 2", "author": "Margery S. Stewart", "etype": "fiction"},
+        {"title": "Forgiveness", "author": "C. Cameron Johns", "etype": "poem"},
+        {"title": "Home", "author": "Beatrice K. Ekman", "etype": "poem"},
+        {"title": "The Dress—Part II", "author": "Fay Tarlock", "etype": "fiction"},
+        {"title": "Notes From the Field: Visiting Teachers Activities, New Organizations, and Anniversary Work", "author": "General Secretary-Treasurer, Margaret C. Pickering", "etype": "article"},
+        {"title": "Theology: From Sunshine to Shadow", "author": "Elder Don B. Colton", "etype": "lesson"},
+        {"title": "Map of Palestine at the Time of Christ", "author": None, "etype": "lesson"},
+        {"title": "The Greatest Love", "author": "Caroline Eyring Miner", "etype": "article"},
+        {"title": "Defeat", "author": "Evelyn Fjeldsted", "etype": "poem"},
+        {"title": "Visiting Teachers Messages: Ye Are the Light of the World", "author": "Elder H. Wayne Driggs", "etype": "lesson"},
+        {"title": "Communion at Midnight", "author": "Lizabeth Wall", "etype": "poem"},
+        {"title": "Literature: Literature of the Prophets Closing Years", "author": "Elder Howard R. Driggs", "etype": "lesson"},
+        {"title": "Social Science: International Strife and the Quest for Peace", "author": "Elder G. Homer Durham", "etype": "lesson"},
+        {"title": "Optional Lessons in Lieu of Social Science: The Presidency of Lorenzo Snow", "author": "Elder T. Edgar Lyon", "etype": "lesson"},
+        {"title": "From Near and Far", "author": None, "etype": "article"},
+        {"title": "Comparison", "author": "Anna S. W. Gould", "etype": "poem"},
+    ],
+
+    ("Vol36", "No03_March_1949"): [
+        {"title": "Vol. 36 MARCH 1949 No.", "author": None, "etype": "article"},
+        {"title": "I Have Seen Aspens", "author": "Alice Morrey Bailey", "etype": "poem"},
+        {"title": "The Spirit of the Gospel, the Soul of Relief Society", "author": "President Belle S. Spafford", "etype": "article"},
+        {"title": "Compromise—Third Prize Story", "author": "Mildred R. Stutz", "etype": "fiction"},
+        {"title": "Relief Society Building News", "author": None, "etype": "article"},
+        {"title": "The Song of the Lark", "author": "Ivy Williams Stone", "etype": "article"},
+        {"title": "This of Destiny", "author": "Elizabeth Terry Blair", "etype": "poem"},
+        {"title": "The House of Leaves", "author": "Blanche Sutherland", "etype": "fiction"},
+        {"title": "A Young Mother Discovers Relief Society", "author": "Margaret F. Richards", "etype": "article"},
+        {"title": "Hawaii and the Latter-day Saints", "author": "Rosannah Cannon Irvine", "etype": "article"},
+        {"title": "Clean-up and Beautification Program", "author": "James M. Kirkham", "etype": "article"},
+        {"title": "Sixty Years Ago", "author": None, "etype": "article"},
+        {"title": "Womans Sphere", "author": "Ramona W. Cannon", "etype": "article"},
+        {"title": "Editorial: Full Measure, Running Over", "author": "Marianne C. Sharp", "etype": "article"},
+        {"title": "Notes to the Field: The Importance of the Visiting Teachers Message", "author": None, "etype": "article"},
+        {"title": "Organizations and Reorganizations of Mission and Stake Relief Societies", "author": None, "etype": "article"},
+        {"title": "Special Short Story Issue Planned for April", "author": None, "etype": "article"},
+        {"title": "Sky Writing", "author": "Marvin Jones", "etype": "poem"},
+        {"title": "Longing", "author": "Susa Gould Walker", "etype": "poem"},
+        {"title": "We Are So Busy", "author": "Sylvia Probst Young", "etype": "fiction"},
+        {"title": "Take Care of Your Books", "author": "Ezra J. Poulsen", "etype": "article"},
+        {"title": "I Have No Need", "author": "Grace Zenor Pratt", "etype": "poem"},
+        {"title": "How to Make a Pleated Skirt", "author": "Lena DuPaix", "etype": "article"},
+        {"title": "They Are Not Mine", "author": "Caroline Eyring Miner", "etype": "article"},
+        {"title": "Compensation", "author": "Jessie M. Robinson", "etype": "poem"},
+        {"title": "How to Make an Embroidery Floss Case", "author": "Afton N. Porter", "etype": "article"},
+        {"title": "Thats My Target!", "author": "Ivie H. Jones", "etype": "article"},
+        {"title": "Art Teacher", "author": "C. Cameron Johns", "etype": "poem"},
+        {"title": "Antiques to Know and Cherish", "author": "Lorene Pearson", "etype": "article"},
+        {"title": "Cotton Storm", "author": "Leone E. McCune", "etype": "poem"},
+        {"title": "Overtone", "author": "Dorothy J. Roberts", "etype": "poem"},
+        {"title": "Cakes Decorated and Designed at Home", "author": "Eva Willes Wangsgaard", "etype": "article"},
+        {"title": "Joanna—Chapter 3", "author": "Margery S. Stewart", "etype": "fiction"},
+        {"title": "Notes From the Field: Relief Society Socials, Bazaars, and Other Activities", "author": "General Secretary-Treasurer, Margaret C. Pickering", "etype": "article"},
+        {"title": "My Wish", "author": "Gene Romolo", "etype": "poem"},
+        {"title": "Spring Candlelight", "author": "Thelma Ireland", "etype": "poem"},
+        {"title": "From Near and Far", "author": None, "etype": "article"},
+    ],
+
+    ("Vol36", "No04_April_1949"): [
+        {"title": "Vol. 36 APRIL 1949 No.", "author": None, "etype": "article"},
+        {"title": "The Half-Believers", "author": "Berta H. Christensen", "etype": "poem"},
+        {"title": "Jesus—Lord of the Resurrection", "author": "Elder Don B. Colton", "etype": "article"},
+        {"title": "The Bog", "author": "Christie Lund Coles", "etype": "fiction"},
+        {"title": "Relief Society Building News", "author": None, "etype": "article"},
+        {"title": "Our Political Inheritance", "author": "Elder G. Homer Durham", "etype": "article"},
+        {"title": "Once", "author": "Belle W. Anderson", "etype": "poem"},
+        {"title": "April Geography", "author": "Ruth Harwood", "etype": "poem"},
+        {"title": "Long Moment", "author": "Rose Thomas Graham", "etype": "poem"},
+        {"title": "Trumpets", "author": "Mary Ek Knowles", "etype": "fiction"},
+        {"title": "Of April Blossoming", "author": "Renie H. Littlewood", "etype": "poem"},
+        {"title": "Through the Darkness", "author": "Hazel K. Todd", "etype": "fiction"},
+        {"title": "The Family Hour in Latter-day Saint Homes", "author": "Lucy Grant Cannon", "etype": "article"},
+        {"title": "Spring", "author": "Beatrice Knowlton Ekman", "etype": "poem"},
+        {"title": "Grantsville and the Desert", "author": "Norma Wrathall", "etype": "article"},
+        {"title": "Sixty Years Ago", "author": None, "etype": "article"},
+        {"title": "Womans Sphere", "author": "Ramona W. Cannon", "etype": "article"},
+        {"title": "Editorial: The Women of Easter", "author": "Vesta P. Crawford", "etype": "article"},
+        {"title": "Congratulations to President Smith on His Seventy-Ninth Birthday", "author": None, "etype": "article"},
+        {"title": "Instructions Regarding Notes From the Field", "author": None, "etype": "article"},
+        {"title": "Table Settings and Flower Arrangements: Easter Table Suggestions", "author": "Mary Grant Judd", "etype": "article"},
+        {"title": "Consider the Lilies", "author": "Jean Chalmers Donaldson", "etype": "poem"},
+        {"title": "The Heart Grows Quiet", "author": "Dorothy J. Roberts", "etype": "poem"},
+        {"title": "An April Day", "author": "Grace M. Candland", "etype": "poem"},
+        {"title": "And All Eternity", "author": "Carol Read Flake", "etype": "fiction"},
+        {"title": "Annual Urge", "author": "Maryhale Woolsey", "etype": "poem"},
+        {"title": "An Easter Party for the Children", "author": "Elizabeth Williamson", "etype": "article"},
+        {"title": "Joanna—Chapter 4", "author": "Margery S. Stewart", "etype": "fiction"},
+        {"title": "Easter-Lily Floor", "author": "Julene J. Cushing", "etype": "poem"},
+        {"title": "Notes From the Field: Socials, Bazaars, and Other Activities", "author": "General Secretary-Treasurer, Margaret C. Pickering", "etype": "article"},
+        {"title": "Eighty-Seventh Birthday", "author": "Nan S. Richardson", "etype": "poem"},
+        {"title": "From Near and Far", "author": None, "etype": "article"},
+    ],
+
+    ("Vol36", "No05_May_1949"): [
+        {"title": "Vol. 36 MAY 1949 No.", "author": None, "etype": "article"},
+        {"title": "This Happy Land", "author": "Nyal W. Anderson", "etype": "poem"},
+        {"title": "Our Responsibility to Inactive Members", "author": "Velma N. Simonsen", "etype": "article"},
+        {"title": "Mothers of Destiny", "author": "Christie Lund Coles", "etype": "poem"},
+        {"title": "May Day", "author": "Ruth Harwood", "etype": "poem"},
+        {"title": "A Pattern for Christine", "author": "Dorothy J. Roberts", "etype": "fiction"},
+        {"title": "Pansy Faces", "author": "Zara Sabin", "etype": "poem"},
+        {"title": "Civil Liberty Today", "author": "G. Homer Durham", "etype": "article"},
+        {"title": "You Might Have Waited", "author": "Fay Tarlock", "etype": "fiction"},
+        {"title": "American Cancer Society Volunteers", "author": "Bertha Hare Long", "etype": "article"},
+        {"title": "Formula", "author": "Anna Prince Redd", "etype": "poem"},
+        {"title": "Planning the Work Meetings", "author": "Leone G. Layton", "etype": "article"},
+        {"title": "Sixty Years Ago", "author": None, "etype": "article"},
+        {"title": "Womans Sphere", "author": "Ramona W. Cannon", "etype": "article"},
+        {"title": "Editorial: Not in the Abundance of the Things Which He Possesseth", "author": "Marianne C. Sharp", "etype": "article"},
+        {"title": "Released to Spring", "author": "C. Cameron Johns", "etype": "poem"},
+        {"title": "Midas and the Five Senses", "author": "Eva Willes Wangsgaard", "etype": "poem"},
+        {"title": "Tears First Dried", "author": "Jeanette P. Parry", "etype": "poem"},
+        {"title": "Joanna—Chapter 5", "author": "Margery S. Stewart", "etype": "fiction"},
+        {"title": "Luncheon Cloths for the Making", "author": "Rachel K. Laurgaard", "etype": "article"},
+        {"title": "Braided Rugs—New-Fashioned", "author": "Drucilla S. Howard", "etype": "article"},
+        {"title": "Spring Planting", "author": "LeRoy Burke Meagher", "etype": "poem"},
+        {"title": "Dawn", "author": "Evelyn Fjeldsted", "etype": "poem"},
+        {"title": "Table Settings and Flower Arrangements: Entertaining the Bride", "author": "Mary Grant Judd", "etype": "article"},
+        {"title": "Magazine Subscriptions for 1948", "author": "Marianne C. Sharp", "etype": "article"},
+        {"title": "The Magazine Honor Roll for 1948", "author": None, "etype": "article"},
+        {"title": "Handle With Gloves", "author": "Ivie H. Jones", "etype": "article"},
+        {"title": "Rainbow Land", "author": "Marvin Jones", "etype": "poem"},
+        {"title": "Notes From the Field: Relief Society Bazaars, Socials, and Other Activities", "author": "General Secretary-Treasurer, Margaret C. Pickering", "etype": "article"},
+        {"title": "From Near and Far", "author": None, "etype": "article"},
+    ],
+
+    ("Vol36", "No06_June_1949"): [
+        {"title": "Vol. 36 JUNE 1949 No.", "author": None, "etype": "article"},
+        {"title": "Sweet Memory", "author": "Dorothy J. Roberts", "etype": "poem"},
+        {"title": "A Measuring Rod for Growth", "author": "Blanche B. Stoddard", "etype": "article"},
+        {"title": "Contest Announcements—1949", "author": None, "etype": "article"},
+        {"title": "Temple Shadows", "author": "Lizabeth Wall", "etype": "poem"},
+        {"title": "Roses Wet With Rain", "author": "Grace Sayre", "etype": "poem"},
+        {"title": "Points for Poets to Remember", "author": "Eva Willes Wangsgaard", "etype": "article"},
+        {"title": "By Memory", "author": "Evelyn Fjeldsted", "etype": "poem"},
+        {"title": "On Writing a Short Story", "author": "Fay Tarlock", "etype": "article"},
+        {"title": "A Song the Heart Must Sing", "author": "Anna Prince Redd", "etype": "poem"},
+        {"title": "Impressions", "author": "Elise B. Maness", "etype": "poem"},
+        {"title": "June", "author": "Christie Lund Coles", "etype": "poem"},
+        {"title": "Young Hearts Are Fragile", "author": "Olive W. Burt", "etype": "fiction"},
+        {"title": "El Paso and the Latter-day Saints", "author": "Sadie Ollorton Clark", "etype": "article"},
+        {"title": "Prayer", "author": "Gene Romolo", "etype": "poem"},
+        {"title": "My Mountain", "author": "Josephine J. Harvey", "etype": "poem"},
+        {"title": "If", "author": "Catherine Renstrom", "etype": "poem"},
+        {"title": "Orchid Hunting in Honduras", "author": "Elizabeth Williamson", "etype": "article"},
+        {"title": "Selective Memory", "author": "Clarence Edwin Flynn", "etype": "poem"},
+        {"title": "Sixty Years Ago", "author": None, "etype": "article"},
+        {"title": "Womans Sphere", "author": "Ramona W. Cannon", "etype": "article"},
+        {"title": "Editorial: The One Hundred Nineteenth Annual General Conference", "author": "Leone G. Layton", "etype": "article"},
+        {"title": "In Memoriam: Mary Ah Ping Ty", "author": None, "etype": "article"},
+        {"title": "Deseret Sunday School Union Centennial Conference", "author": None, "etype": "article"},
+        {"title": "Corrections in Magazine Honor Roll", "author": None, "etype": "article"},
+        {"title": "Of Silver Laughter", "author": "Renie H. Littlewood", "etype": "poem"},
+        {"title": "Table Settings and Flower Arrangements: Pleasure From Simple Things", "author": "A. J. Neff", "etype": "article"},
+        {"title": "Margery", "author": "Katherine F. Larsen", "etype": "poem"},
+        {"title": "Pressed Flower Pictures—a Designing Hobby", "author": None, "etype": "article"},
+        {"title": "Inner Resources", "author": "Caroline Eyring Miner", "etype": "article"},
+        {"title": "A Familys a Family", "author": "Estelle Webb Thomas", "etype": "fiction"},
+        {"title": "Rescue That Little Rocker", "author": "Rachel K. Laurgaard", "etype": "article"},
+        {"title": "Carrot Marmalade", "author": "Frances Kolarik", "etype": "article"},
+        {"title": "Joanna—Chapter 6", "author": "Margery S. Stewart", "etype": "fiction"},
+        {"title": "Notes From the Field: Anniversary Socials, Bazaars, and Other Activities", "author": "General Secretary-Treasurer, Margaret C. Pickering", "etype": "article"},
+        {"title": "From Near and Far", "author": None, "etype": "article"},
+    ],
+
+    ("Vol36", "No07_July_1949"): [
+        {"title": "Vol. 36 JULY 1949 No.", "author": None, "etype": "article"},
+        {"title": "Pioneer Mother", "author": "Ruth H. Chadwick", "etype": "poem"},
+        {"title": "For Those Who Come After", "author": "Anna Prince Redd", "etype": "article"},
+        {"title": "A Tribute to the Pioneer Mother", "author": "Lucy Fryer Vance", "etype": "article"},
+        {"title": "Nellie Ward Neal Appointed to the Relief Society General Board", "author": "Roxey Robson Heslop", "etype": "article"},
+        {"title": "Tiny Feet", "author": "Iris W. Schow", "etype": "poem"},
+        {"title": "Embryo", "author": "C. Cameron Johns", "etype": "poem"},
+        {"title": "Mood of Alice", "author": "Ruth Harwood", "etype": "poem"},
+        {"title": "The Land of the High Uintahs", "author": "Olive W. Burt", "etype": "article"},
+        {"title": "The Jumpher Family: Mama and Papa", "author": "Deone R. Sutherland", "etype": "fiction"},
+        {"title": "Sixty Years Ago", "author": None, "etype": "article"},
+        {"title": "Womans Sphere", "author": "Ramona W. Cannon", "etype": "article"},
+        {"title": "Editorial: The New Frontier", "author": "Vesta P. Crawford", "etype": "article"},
+        {"title": "Birthday Greetings to Sister Augusta Winters Grant", "author": None, "etype": "article"},
+        {"title": "Table Settings and Flower Arrangements: Table Settings for the Canyon", "author": "Mary Grant Judd", "etype": "article"},
+        {"title": "Fireworks", "author": "Christie Lund Coles", "etype": "poem"},
+        {"title": "Joanna—Chapter 7", "author": "Margery S. Stewart", "etype": "fiction"},
+        {"title": "Louisa Allen Thomas Makes a Pioneer Quilt", "author": None, "etype": "article"},
+        {"title": "Lets Vary the Picnic Menu", "author": "Rachel K. Laurgaard", "etype": "article"},
+        {"title": "Make Use of the Rocks", "author": "Ezra J. Poulsen", "etype": "article"},
+        {"title": "Bear Lake", "author": "Eva Willes Wangsgaard", "etype": "poem"},
+        {"title": "Salads of Infinite Variety", "author": "Sara Mills", "etype": "article"},
+        {"title": "Suggestions for a Work Meeting Luncheon", "author": "Christine Eaton", "etype": "article"},
+        {"title": "Notes on Authors of the Lessons", "author": None, "etype": "lesson"},
+        {"title": "That America Might Be", "author": "Mabel Jones Gabbott", "etype": "poem"},
+        {"title": "Theology: The Life and Ministry of the Savior, Preview", "author": None, "etype": "lesson"},
+        {"title": "Jesus Began in Galilee", "author": "Don B. Colton", "etype": "lesson"},
+        {"title": "Visiting Teacher Messages: Our Savior Speaks, Preview", "author": None, "etype": "lesson"},
+        {"title": "I Am Come That They Might Have Life", "author": "Mary Grant Judd", "etype": "lesson"},
+        {"title": "Work Meeting—Sewing Childrens Clothing, Preview", "author": None, "etype": "lesson"},
+        {"title": "Proper Selection of Style, Choice of Material and Pattern", "author": "Jean Ridges Jennings", "etype": "lesson"},
+        {"title": "Literature: The Literature of England, Preview", "author": None, "etype": "lesson"},
+        {"title": "Introduction", "author": "Briant S. Jacobs", "etype": "lesson"},
+        {"title": "Social Science: The Progress of Man, Preview", "author": None, "etype": "lesson"},
+        {"title": "President Joseph F. Smith", "author": "T. Edgar Lyon", "etype": "lesson"},
+        {"title": "Music: Fundamentals of Musicianship, Preview", "author": None, "etype": "lesson"},
+        {"title": "Patriot Day", "author": "Josephine J. Harvey", "etype": "poem"},
+        {"title": "The First Presidencies, Preview", "author": None, "etype": "lesson"},
+        {"title": "Upon the Bluebirds Wing", "author": "Margaret B. Shomaker", "etype": "poem"},
+        {"title": "From Near and Far", "author": None, "etype": "article"},
+    ],
+
+    ("Vol36", "No08_August_1949"): [
+        {"title": "Vol. 36 AUGUST 1949 No.", "author": None, "etype": "article"},
+        {"title": "Sand and Flame", "author": "Anna Prince Redd", "etype": "poem"},
+        {"title": "The Tasks of Modern Citizenship", "author": "G. Homer Durham", "etype": "article"},
+        {"title": "Immortality", "author": "Jessie M. Robinson", "etype": "poem"},
+        {"title": "Relief Society Building News", "author": None, "etype": "article"},
+        {"title": "More at Peace", "author": "Christie Lund Coles", "etype": "poem"},
+        {"title": "Music in the Home", "author": "Norma Wrathall", "etype": "fiction"},
+        {"title": "Rugmaking in the New England Mission", "author": "S. Dilworth Young", "etype": "article"},
+        {"title": "August", "author": "Mary Rigby", "etype": "poem"},
+        {"title": "The Jumpher Family: Part II—Ready", "author": "Deone R. Sutherland", "etype": "fiction"},
+        {"title": "Moment", "author": "Georgia Moore Eberling", "etype": "poem"},
+        {"title": "Remembrance", "author": "Ora Lee Parthesius", "etype": "poem"},
+        {"title": "What The Relief Society Magazine Means to Me", "author": "Alice Morrey Bailey", "etype": "article"},
+        {"title": "Words and Music", "author": "Bernice Brown", "etype": "fiction"},
+        {"title": "Sixty Years Ago", "author": None, "etype": "article"},
+        {"title": "Womans Sphere", "author": "Ramona W. Cannon", "etype": "article"},
+        {"title": "Editorial: Television in the Home", "author": "Marianne C. Sharp", "etype": "article"},
+        {"title": "Notes to the Field: Relief Society Handbook of Instructions Ready for Distribution", "author": None, "etype": "article"},
+        {"title": "Duplicate Lists of Contributors to Relief Society Building Fund", "author": None, "etype": "article"},
+        {"title": "Table Settings and Flower Arrangements", "author": "Mary Grant Judd", "etype": "article"},
+        {"title": "Glamour Weeds", "author": "Frances Aveson Wiscomb", "etype": "article"},
+        {"title": "Wisteria Blossoms", "author": "Grace Sayre", "etype": "poem"},
+        {"title": "Joanna—Chapter 8", "author": "Margery S. Stewart", "etype": "fiction"},
+        {"title": "Suggestions for a Work Meeting Luncheon", "author": "Christine Eaton", "etype": "article"},
+        {"title": "A Circus is Always Fun", "author": "Rachel K. Laurgaard", "etype": "article"},
+        {"title": "All Serene", "author": "Dorothy J. Roberts", "etype": "poem"},
+        {"title": "Dream", "author": "Edna S. Dustin", "etype": "poem"},
+        {"title": "Notes From the Field", "author": "General Secretary-Treasurer, Margaret C. Pickering", "etype": "article"},
+        {"title": "Theology: Our Lords Ministry in Perea and Judea", "author": "Don B. Colton", "etype": "lesson"},
+        {"title": "Visiting Teacher Messages: Behold, I Stand at the Door and Knock", "author": "Mary Grant Judd", "etype": "lesson"},
+        {"title": "Work Meeting—Sewing: Layettes and Baby Sewing", "author": "Jean Ridges Jennings", "etype": "lesson"},
+        {"title": "Blind and Blues", "author": "Wanda Green Nielson", "etype": "poem"},
+        {"title": "Literature: Legends of Chivalry", "author": "Briant S. Jacobs", "etype": "lesson"},
+        {"title": "Social Science: The Significance of the Declaration of Belief", "author": "G. Homer Durham", "etype": "lesson"},
+        {"title": "Optional Lessons: The Counselors to President Joseph F. Smith", "author": "T. Edgar Lyon", "etype": "lesson"},
+        {"title": "Lullaby", "author": "Jo Adelaide Stock", "etype": "poem"},
+        {"title": "Poem for a Washday", "author": "Miranda Snow Walton", "etype": "poem"},
+        {"title": "From Near and Far", "author": None, "etype": "article"},
+    ],
+
+    ("Vol36", "No09_September_1949"): [
+        {"title": "Vol. 36 SEPTEMBER 1949 No.", "author": None, "etype": "article"},
+        {"title": "Poplar Magic", "author": "Ruth Harwood", "etype": "poem"},
+        {"title": "The Mormon Handicraft Shop", "author": "Ethel C. Smith", "etype": "article"},
+        {"title": "Patchwork Quilts", "author": "Alice Whitson Norton", "etype": "article"},
+        {"title": "Tranquility", "author": "Celia Van Cott", "etype": "poem"},
+        {"title": "Autumn Winds", "author": "Dorothy J. Roberts", "etype": "poem"},
+        {"title": "Relief Society Building News", "author": None, "etype": "article"},
+        {"title": "Autumn", "author": "Margaret B. Shomaker", "etype": "poem"},
+        {"title": "Tempered—Part I", "author": "Gladys I. Hamilton", "etype": "fiction"},
+        {"title": "That He May Know", "author": "LeRoy Burke Meagher", "etype": "poem"},
+        {"title": "Zion National Park", "author": "Willard Luce", "etype": "article"},
+        {"title": "Song", "author": "Sylvia Probst Young", "etype": "poem"},
+        {"title": "Sixty Years Ago", "author": None, "etype": "article"},
+        {"title": "Womans Sphere", "author": "Ramona W. Cannon", "etype": "article"},
+        {"title": "Editorial: Women Who Sew Together", "author": "Vesta P. Crawford", "etype": "article"},
+        {"title": "Notes to the Field: Annual General Relief Society Conference", "author": None, "etype": "article"},
+        {"title": "Buying Textbooks for Relief Society Lessons", "author": None, "etype": "article"},
+        {"title": "The Making and Use of Decorative Candles", "author": "Mary Grant Judd", "etype": "article"},
+        {"title": "The Heart", "author": "Essie M. Robinson", "etype": "poem"},
+        {"title": "Edith Bunn Makes Unique Wagon-Wheel Rugs", "author": "Mirinda Knapp", "etype": "article"},
+        {"title": "Suggestions for a Work Meeting Luncheon", "author": "Christine Eaton", "etype": "article"},
+        {"title": "Wastebaskets Where You Want Them", "author": "Rachel K. Laurgaard", "etype": "article"},
+        {"title": "Marriage", "author": "Grace Sayre", "etype": "poem"},
+        {"title": "Martha, Papoose of the Great Spirit", "author": "James C. Young", "etype": "fiction"},
+        {"title": "Blue Hills", "author": "Helen Gee Woods", "etype": "poem"},
+        {"title": "Joanna—Chapter 9", "author": "Margery S. Stewart", "etype": "fiction"},
+        {"title": "Annual Report—1948", "author": "General Secretary-Treasurer, Margaret C. Pickering", "etype": "article"},
+        {"title": "Reprint of Shakespeares Sonnet 73", "author": None, "etype": "poem"},
+        {"title": "Notes From the Field: Anniversary Parties, Bazaars, and Other Activities", "author": "General Secretary-Treasurer, Margaret C. Pickering", "etype": "article"},
+        {"title": "Theology: Continuation of the Perean and Judean Ministry", "author": "Don B. Colton", "etype": "lesson"},
+        {"title": "Interval", "author": "Evelyn Fjeldsted", "etype": "poem"},
+        {"title": "Visiting Teacher Messages: These Things I Have Spoken Unto You", "author": "Mary Grant Judd", "etype": "lesson"},
+        {"title": "Work Meeting—Sewing: Childrens Clothing", "author": "Jean Ridges Jennings", "etype": "lesson"},
+        {"title": "Literature: The Poet Shakespeare", "author": "Briant S. Jacobs", "etype": "lesson"},
+        {"title": "A Friend Like You", "author": "Hilde Wittemund", "etype": "poem"},
+        {"title": "My Valley", "author": "Jeanette P. Parry", "etype": "poem"},
+        {"title": "From Near and Far", "author": None, "etype": "article"},
+    ],
+
+    ("Vol36", "No10_October_1949"): [
+        {"title": "Vol. 36 OCTOBER 1949 No.", "author": None, "etype": "article"},
+        {"title": "Time for Sorting", "author": "Eva Willes Wangsgaard", "etype": "poem"},
+        {"title": "Making Our Homes More Livable", "author": "Christine H. Robinson", "etype": "article"},
+        {"title": "Veteran", "author": "Christie Lund Coles", "etype": "poem"},
+        {"title": "You Can Learn—Part I—A is for Adult—B is for Bride", "author": "Katherine Kelly", "etype": "fiction"},
+        {"title": "Adoption of Children", "author": "Mary L. Dillman", "etype": "article"},
+        {"title": "Tempered—Part II", "author": "Gladys I. Hamilton", "etype": "fiction"},
+        {"title": "Just Naturally", "author": "Iris W. Schow", "etype": "poem"},
+        {"title": "Sixty Years Ago", "author": None, "etype": "article"},
+        {"title": "Womans Sphere", "author": "Ramona W. Cannon", "etype": "article"},
+        {"title": "Editorial: The Best of Friends", "author": "Marianne C. Sharp", "etype": "article"},
+        {"title": "Notes to the Field: Relief Society Handbook Obtainable Only at Office of General Board", "author": None, "etype": "article"},
+        {"title": "The Interest and Beauty of Fruit", "author": "Mary Grant Judd", "etype": "article"},
+        {"title": "A Halloween Spook Table", "author": "Rachel K. Laurgaard", "etype": "article"},
+        {"title": "Suggestions for a Work Meeting Luncheon", "author": "Christine Eaton", "etype": "article"},
+        {"title": "A Sidewalk Sketch", "author": "Elaine Swain", "etype": "poem"},
+        {"title": "Joanna—Chapter 10", "author": "Margery S. Stewart", "etype": "fiction"},
+        {"title": "Home Safety—a Family Affair", "author": "Nellie O. Parker", "etype": "article"},
+        {"title": "Crocheting Is Her Hobby", "author": None, "etype": "article"},
+        {"title": "October", "author": "Elizabeth Johnson", "etype": "poem"},
+        {"title": "Lets Do Better Embroidery", "author": "Doris Feil", "etype": "article"},
+        {"title": "Notes From the Field: Bazaars, Singing Mothers, Socials, and Other Activities", "author": "General Secretary-Treasurer, Margaret C. Pickering", "etype": "article"},
+        {"title": "Theology: The Perean and Judean Ministry and The Last Winter", "author": "Don B. Colton", "etype": "lesson"},
+        {"title": "Opportunity", "author": "Evelyn Fjeldsted", "etype": "poem"},
+        {"title": "Visiting Teacher Messages: Lovest Thou Me? Feed My Lambs", "author": "Mary Grant Judd", "etype": "lesson"},
+        {"title": "Work Meeting: Underwear and Nightwear", "author": "Jean Ridges Jennings", "etype": "lesson"},
+        {"title": "Literature: The English Bible", "author": "Briant S. Jacobs", "etype": "lesson"},
+        {"title": "Social Science: Governments Instituted for the Benefit of Man", "author": "G. Homer Durham", "etype": "lesson"},
+        {"title": "Against the Years", "author": "Dorothy J. Roberts", "etype": "poem"},
+        {"title": "Optional Lessons in Lieu of Social Science: President Heber J. Grant", "author": "T. Edgar Lyon", "etype": "lesson"},
+        {"title": "Brides Illusion for a Home", "author": "Lael W. Hill", "etype": "poem"},
+        {"title": "From Near and Far", "author": None, "etype": "article"},
+    ],
+
+    ("Vol36", "No11_November_1949"): [
+        {"title": "Vol. 36 NOVEMBER 1949 No.", "author": None, "etype": "article"},
+        {"title": "Rain on November Night", "author": "Marvin Jones", "etype": "poem"},
+        {"title": "Womans Role as Homemaker", "author": "President Belle S. Spafford", "etype": "article"},
+        {"title": "Today Is All of Time", "author": "Maude O. Cook", "etype": "poem"},
+        {"title": "The Loving Friend of Children", "author": "Preston Nibley", "etype": "article"},
+        {"title": "The Pongee Dress", "author": "Grace M. Candland", "etype": "fiction"},
+        {"title": "Alien and Lost", "author": "Dorothy J. Roberts", "etype": "poem"},
+        {"title": "Poem", "author": "Gertrude T. Koven", "etype": "poem"},
+        {"title": "Silence", "author": "Mary Pack Triplett", "etype": "poem"},
+        {"title": "Ancient Rites at a Modern Wedding", "author": "Martha Toronto", "etype": "article"},
+        {"title": "I Saw Palestine", "author": "Ann Rich", "etype": "article"},
+        {"title": "Sixty Years Ago", "author": None, "etype": "article"},
+        {"title": "Womans Sphere", "author": "Ramona W. Cannon", "etype": "article"},
+        {"title": "Editorial: Thanksgiving Without a Feast", "author": "Vesta P. Crawford", "etype": "article"},
+        {"title": "Ascendant Autumn", "author": "Ruth Harwood", "etype": "poem"},
+        {"title": "Earth Decorator", "author": "Christie Lund Coles", "etype": "poem"},
+        {"title": "Suggestions for a Work Meeting Luncheon", "author": "Christine Eaton", "etype": "article"},
+        {"title": "The Long Wait", "author": "Lael W. Hill", "etype": "poem"},
+        {"title": "Joanna—Chapter 11", "author": "Margery S. Stewart", "etype": "fiction"},
+        {"title": "Night", "author": "Gene Romolo", "etype": "poem"},
+        {"title": "Fun With Spools", "author": "Rachel K. Laurgaard", "etype": "article"},
+        {"title": "November Moon", "author": "Margaret B. Shomaker", "etype": "poem"},
+        {"title": "You Can Learn—Part II", "author": "Katherine Kelly", "etype": "fiction"},
+        {"title": "Pioneer Recipe", "author": "Anna Prince Redd", "etype": "article"},
+        {"title": "November Day", "author": "Beatrice K. Ekman", "etype": "poem"},
+        {"title": "The Interest and Beauty of Vegetables", "author": "Mary Grant Judd", "etype": "article"},
+        {"title": "Beauty in Brown", "author": "Josephine J. Harvey", "etype": "poem"},
+        {"title": "A Letter From Mother", "author": "Clara Horne Park", "etype": "article"},
+        {"title": "Notes From the Field: Activities in the Missions, Socials, and Handicraft", "author": "General Secretary-Treasurer, Margaret C. Pickering", "etype": "article"},
+        {"title": "Theology: On to Jerusalem", "author": "Don B. Colton", "etype": "lesson"},
+        {"title": "Visiting Teacher Messages: Is Not the Life More Than Meat?", "author": "Mary Grant Judd", "etype": "lesson"},
+        {"title": "Work Meeting: Girls Clothing", "author": "Jean Ridges Jennings", "etype": "lesson"},
+        {"title": "Star Music", "author": "Grace Sayre", "etype": "poem"},
+        {"title": "Literature: Sir Francis Bacon", "author": "Briant S. Jacobs", "etype": "lesson"},
+        {"title": "Social Science: Public Administration and Good Government", "author": "G. Homer Durham", "etype": "lesson"},
+        {"title": "Optional Lessons: The Counselors to President Heber J. Grant", "author": "T. Edgar Lyon", "etype": "lesson"},
+        {"title": "Thanksgiving Day", "author": "Nan S. Richardson", "etype": "poem"},
+        {"title": "From Near and Far", "author": None, "etype": "article"},
+    ],
+
+    ("Vol36", "No12_December_1949"): [
+        {"title": "Vol. 36 DECEMBER 1949 No.", "author": None, "etype": "article"},
+        {"title": "The Flight", "author": "Dorothy J. Roberts", "etype": "poem"},
+        {"title": "The Prophets Sailing Orders to Relief Society", "author": "President J. Reuben Clark, Jr.", "etype": "article"},
+        {"title": "Joy in Service", "author": "Counselor Marianne C. Sharp", "etype": "article"},
+        {"title": "Introduction to Lesson Courses", "author": "Counselor Marianne C. Sharp", "etype": "article"},
+        {"title": "Relief Society in the Lives of Our Sisters in Europe", "author": "Nida A. Taggart", "etype": "article"},
+        {"title": "Hints on Lesson Development", "author": "Leone O. Jacobs", "etype": "article"},
+        {"title": "Fostering Creative Homemaking Arts", "author": "Leone G. Layton", "etype": "article"},
+        {"title": "With Liberty and Justice for All", "author": "Edith S. Elliott", "etype": "article"},
+        {"title": "Unwashen Hands Versus Hearts", "author": "Spencer W. Kimball", "etype": "article"},
+        {"title": "Report and Official Instructions", "author": "President Belle S. Spafford", "etype": "article"},
+        {"title": "Meeting Our Obligations", "author": "Counselor Velma N. Simonsen", "etype": "article"},
+        {"title": "Joy in Leadership", "author": "Counselor Marianne C. Sharp", "etype": "article"},
+        {"title": "Choose You This Day", "author": "Evon W. Peterson", "etype": "article"},
+        {"title": "Cultivating Lifes Eternal Values", "author": "Mary J. Wilson", "etype": "article"},
+        {"title": "Prepare Thy Heart", "author": "Leone O. Jacobs", "etype": "article"},
+        {"title": "Ready for Christmas", "author": "Ora Pate Stewart", "etype": "fiction"},
+        {"title": "Sixty Years Ago", "author": None, "etype": "article"},
+        {"title": "Womans Sphere", "author": "Ramona W. Cannon", "etype": "article"},
+        {"title": "Editorials: Christmas Down the Years; The 120th Semi-Annual Church Conference; Litter on Temple Square", "author": "Marianne C. Sharp", "etype": "article"},
+        {"title": "Dimensions", "author": "Della Adams Leitner", "etype": "poem"},
+        {"title": "Joanna (Conclusion)", "author": "Margery S. Stewart", "etype": "fiction"},
+        {"title": "Ideas for Christmas Decoration", "author": "Mary Grant Judd", "etype": "article"},
+        {"title": "March Anniversary Work Meeting Luncheon", "author": "Christine Eaton", "etype": "article"},
+        {"title": "The Year Is Done", "author": "Eunice J. Miles", "etype": "poem"},
+        {"title": "A Santa Claus Cookie Box", "author": "Rachel K. Laurgaard", "etype": "article"},
+        {"title": "Auditor", "author": "Grace Sayre", "etype": "poem"},
+        {"title": "An Ever-Burning Christmas Candle", "author": "Rachel K. Laurgaard", "etype": "article"},
+        {"title": "A Letter from Mother", "author": "Clara Horne Park", "etype": "article"},
+        {"title": "Theology: Jesus Returns to the Temple Daily", "author": "Don B. Colton", "etype": "lesson"},
+        {"title": "Visiting Teacher Messages: For This Cause", "author": "Mary Grant Judd", "etype": "lesson"},
+        {"title": "Work Meeting: Boys Clothing", "author": "Jean Ridges Jennings", "etype": "lesson"},
+        {"title": "Literature: John Bunyan", "author": "Briant S. Jacobs", "etype": "lesson"},
+        {"title": "Substitute", "author": "Thelma Ireland", "etype": "poem"},
+        {"title": "Social Science: The Obligations of Citizenship", "author": "G. Homer Durham", "etype": "lesson"},
+        {"title": "Optional Lesson: The Counselors to President Heber J. Grant (Continued)", "author": "T. Edgar Lyon", "etype": "lesson"},
+        {"title": "In This Be Lavish", "author": "Iris W. Schow", "etype": "poem"},
+        {"title": "A Christmas Song", "author": "Irene Storey", "etype": "poem"},
+        {"title": "Holy Night", "author": "Christie Lund Coles", "etype": "poem"},
+        {"title": "Snowflakes", "author": "Elise Maness", "etype": "poem"},
+        {"title": "Remnant", "author": "Marvin Jones", "etype": "poem"},
+        {"title": "From Near and Far", "author": None, "etype": "article"},
+        {"title": "Blizzard", "author": "Evelyn Fjeldsted", "etype": "poem"},
+    ],
+}